@@ -1,30 +1,78 @@
+import functools
+import threading
 import time
 import urllib.parse
-from logging import Logger
-from typing import Literal, Union, overload
+from collections import OrderedDict
+from logging import DEBUG, Logger
+from typing import Any, Literal, Optional, Union, overload
 
-from requests import HTTPError, Session
+import urllib3
+from requests import HTTPError, Response, Session
 from requests.adapters import HTTPAdapter, Retry
 from requests.exceptions import RequestException, Timeout
+from urllib3.util import make_headers
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
 
 
 class GitLabAPIError(Exception):
     """Custom exception for GitLab API errors."""
 
 
+@functools.lru_cache(maxsize=256, typed=True)
+def _quote_project(project: str | int) -> str:
+    """Returns the project id/path in correct format"""
+    if isinstance(project, int):
+        return str(project)
+
+    # URL-encode the project path
+    return urllib.parse.quote_from_bytes(project.encode("utf-8"), safe=b"")
+
+
+URLLIB3_V2 = int(urllib3.__version__.split(".")[0]) >= 2
+
+# Every encoding urllib3 can decode: brotli (br) and zstd are only listed when
+# a decoder for them is installed, e.g. `pip install urllib3[brotli]`
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+
 class GitlabAPI:
     """GitLab API client for fetching pipeline and project data."""
 
+    __slots__ = (
+        "_base_url",
+        "_api_prefix",
+        "_session",
+        "_etag_cache",
+        "_etag_lock",
+        "logger",
+    )
+
     SESSION_MAX_RETRIES = 3
     SESSION_BACKOFF_FACTOR = 0.3
-    SESSION_ALLOWED_METHODS = {"GET", "POST", "PUT", "DELETE"}
+    SESSION_BACKOFF_MAX = 5  # seconds
+    # POST is not idempotent, so it is never retried automatically
+    SESSION_ALLOWED_METHODS = {"GET", "PUT", "DELETE"}
+    SESSION_RETRY_STATUSES = {429, 502, 503, 504}
     SESSION_POOL_CONNECTIONS = 10
-    SESSION_POOL_MAXSIZE = 20
+    # pool_maxsize is per host, and the TUI talks to a single GitLab host, so
+    # this must cover every concurrent request or connections get discarded
+    SESSION_POOL_MAXSIZE = 32
     REQUEST_TIMEOUT = 30  # seconds
+    ETAG_CACHE_SIZE = 128  # responses kept for conditional GET requests
 
     def __init__(self, logger: Logger, base_url: str, auth_token: str):
         # Remove trailing slash from base_url
         self._base_url = base_url.rstrip("/")
+        self._api_prefix = f"{self._base_url}/api/v4"
+        self._etag_cache: OrderedDict[str, tuple[str, Union[list, dict]]] = (
+            OrderedDict()
+        )
+        # Requests run on a thread pool, so every cache access holds this lock
+        self._etag_lock = threading.Lock()
 
         self._session = self._create_session(auth_token)
 
@@ -41,10 +89,19 @@ class GitlabAPI:
     def _create_session(self, auth_token: str) -> Session:
         session = Session()
 
+        retry_kwargs: dict[str, Any] = {}
+        if URLLIB3_V2:
+            retry_kwargs["backoff_max"] = self.SESSION_BACKOFF_MAX
+
         retry_strategy = Retry(
             total=self.SESSION_MAX_RETRIES,
             backoff_factor=self.SESSION_BACKOFF_FACTOR,
             allowed_methods=self.SESSION_ALLOWED_METHODS,
+            status_forcelist=self.SESSION_RETRY_STATUSES,
+            respect_retry_after_header=True,
+            # Hand the final response back so raise_for_status reports it
+            raise_on_status=False,
+            **retry_kwargs,
         )
 
         adapter = HTTPAdapter(
@@ -55,6 +112,7 @@ class GitlabAPI:
         )
 
         session.mount("https://", adapter)
+        session.mount("http://", adapter)
 
         auth_headers = self._create_auth_headers(auth_token)
 
@@ -62,6 +120,7 @@ class GitlabAPI:
             {
                 "Content-Type": "application/json",
                 "Accept": "application/json",
+                "Accept-Encoding": ACCEPT_ENCODING,
                 **auth_headers,
             }
         )
@@ -84,36 +143,72 @@ class GitlabAPI:
     def _make_request(
         self, method: str, endpoint: str, expect_list: bool = False, **kwargs
     ) -> Union[list, dict]:
-        """Make a request to the GitLab API with proper error handling."""
-        url = f"{self._base_url}/api/v4{endpoint}"
-        self.logger.debug(f"Making {method} request to: {url}")
+        """Make a request to the GitLab API with proper error handling.
+
+        GET responses with an ETag are cached, and a 304 Not Modified returns
+        the cached object itself, so callers must not mutate the result.
+        """
+        url = self._api_prefix + endpoint
+        self.logger.debug("Making %s request to: %s", method, url)
 
         # Log request parameters (excluding sensitive data)
         if "params" in kwargs:
-            self.logger.debug(f"Request params: {kwargs['params']}")
+            self.logger.debug("Request params: %s", kwargs["params"])
+
+        # Ask GitLab to skip the body if we already hold the current version
+        cache_key = self._etag_cache_key(url, kwargs.get("params"))
+        cached = None
+        if method == "GET":
+            with self._etag_lock:
+                cached = self._etag_cache.get(cache_key)
+        if cached is not None:
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "If-None-Match": cached[0],
+            }
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             response = self._session.request(
                 method=method, url=url, timeout=self.REQUEST_TIMEOUT, **kwargs
             )
 
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             self.logger.debug(
-                f"Request completed in {elapsed:.3f}s - Status: {response.status_code}"
+                "Request completed in %.3fs - Status: %s", elapsed, response.status_code
             )
 
             response.raise_for_status()
-            result = response.json()
+
+            if cached is not None and response.status_code == 304:
+                self.logger.debug("Resource not modified, using cached response")
+                with self._etag_lock:
+                    # Another request may have evicted it since the lookup,
+                    # but the response in hand is still current
+                    if cache_key in self._etag_cache:
+                        self._etag_cache.move_to_end(cache_key)
+                return cached[1]
+
+            if response.status_code == 204 or not response.content:
+                self.logger.debug("Response has no content")
+                return [] if expect_list else {}
+
+            result = self._decode_json(response)
+
+            etag = response.headers.get("ETag")
+            if method == "GET" and etag:
+                self._store_etag(cache_key, etag, result)
 
             # Log response size
-            if isinstance(result, list):
-                self.logger.debug(f"Response contains {len(result)} items")
-            elif isinstance(result, dict):
-                self.logger.debug(
-                    f"Response contains dict with keys: {list(result.keys())[:5]}..."
-                )  # First 5 keys
+            if self.logger.isEnabledFor(DEBUG):
+                if isinstance(result, list):
+                    self.logger.debug("Response contains %d items", len(result))
+                elif isinstance(result, dict):
+                    self.logger.debug(
+                        "Response contains dict with keys: %s...",
+                        list(result)[:5],  # First 5 keys
+                    )
 
             return result
 
@@ -121,7 +216,7 @@ class GitlabAPI:
             self.logger.error(f"Request timeout after {self.REQUEST_TIMEOUT}s: {url}")
             raise GitLabAPIError(f"Request timed out: {url}")
         except HTTPError as e:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             self.logger.error(
                 f"HTTP error after {elapsed:.3f}s - Status {e.response.status_code}: {url}"
             )
@@ -140,20 +235,42 @@ class GitlabAPI:
 
                 raise GitLabAPIError(f"HTTP {e.response.status_code}: {error_text}")
         except RequestException as e:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             self.logger.error(f"Request exception after {elapsed:.3f}s: {str(e)}")
             raise GitLabAPIError(f"Request failed: {str(e)}")
 
+    def _etag_cache_key(self, url: str, params: Optional[dict]) -> str:
+        """Build the ETag cache key for a request URL and its query params."""
+        if not params:
+            return url
+        return f"{url}?{urllib.parse.urlencode(sorted(params.items()))}"
+
+    def _store_etag(self, cache_key: str, etag: str, result: Union[list, dict]) -> None:
+        """Store a response for conditional requests, evicting the oldest entry."""
+        with self._etag_lock:
+            self._etag_cache[cache_key] = (etag, result)
+            self._etag_cache.move_to_end(cache_key)
+            if len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+
+    def _decode_json(self, response: Response) -> Union[list, dict]:
+        """Decode a JSON response body, using orjson when it is available.
+
+        orjson parses the raw UTF-8 bytes directly, skipping the bytes -> str
+        -> parse round trip done by the stdlib json module.
+        """
+        if orjson is None:
+            return response.json()
+
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            self.logger.error(f"Failed to decode JSON response: {e}")
+            raise GitLabAPIError(f"Invalid JSON response: {e}")
+
     def _parse_project(self, project: str | int) -> str:
         """Returns the project id/path in correct format"""
-        # URL-encode the project path if it's a string
-        project_param: str
-        if isinstance(project, str):
-            project_param = urllib.parse.quote(project, safe="")
-        else:
-            project_param = str(project)
-
-        return project_param
+        return _quote_project(project)
 
     def get_project(self, project: Union[int, str]) -> dict:
         """Get project information.
@@ -192,22 +309,25 @@ class GitlabAPI:
         )
 
     def get_pipeline_jobs(
-        self, project: Union[int, str], pipeline_id: int
+        self, project: Union[int, str], pipeline_id: int, per_page: int = 100
     ) -> list[dict]:
         """Get jobs for a specific pipeline.
 
         Args:
             project: The project ID (integer) or URL-encoded project path (string)
             pipeline_id: The pipeline ID
+            per_page: Number of jobs to return (GitLab caps this at 100)
 
         Returns:
             list: List of job objects
         """
         project_param = self._parse_project(project)
+        params = {"per_page": per_page}
 
         return self._make_request(
             "GET",
             f"/projects/{project_param}/pipelines/{pipeline_id}/jobs",
+            params=params,
             expect_list=True,
         )
 
@@ -1,14 +1,14 @@
-STATUSES = [
+STATUSES = (
     "success",
     "failed",
     "running",
     "pending",
     "canceled",
     "skipped",
-]
-STAGES = ["build", "test", "security", "deploy", "cleanup", "notify"]
+)
+STAGES = ("build", "test", "security", "deploy", "cleanup", "notify")
 JOB_NAMES = {
-    "build": [
+    "build": (
         "compile",
         "build-frontend",
         "build-backend",
@@ -21,8 +21,8 @@ JOB_NAMES = {
         "gradle-build",
         "npm-build",
         "yarn-build",
-    ],
-    "test": [
+    ),
+    "test": (
         "unit-tests",
         "integration-tests",
         "e2e-tests",
@@ -35,8 +35,8 @@ JOB_NAMES = {
         "load-tests",
         "cypress-tests",
         "jest-tests",
-    ],
-    "security": [
+    ),
+    "security": (
         "sast",
         "dependency-check",
         "container-scan",
@@ -49,8 +49,8 @@ JOB_NAMES = {
         "codeql-analysis",
         "snyk-scan",
         "trivy-scan",
-    ],
-    "deploy": [
+    ),
+    "deploy": (
         "deploy-staging",
         "deploy-prod",
         "deploy-review",
@@ -63,8 +63,8 @@ JOB_NAMES = {
         "aws-deploy",
         "gcp-deploy",
         "azure-deploy",
-    ],
-    "cleanup": [
+    ),
+    "cleanup": (
         "cleanup-artifacts",
         "cleanup-cache",
         "prune-images",
@@ -73,8 +73,8 @@ JOB_NAMES = {
         "cleanup-workspace",
         "docker-prune",
         "cleanup-old-builds",
-    ],
-    "notify": [
+    ),
+    "notify": (
         "slack-notify",
         "email-notify",
         "webhook-notify",
@@ -83,9 +83,9 @@ JOB_NAMES = {
         "jira-update",
         "status-update",
         "report-generate",
-    ],
+    ),
 }
-COMMIT_MESSAGES = [
+COMMIT_MESSAGES = (
     "Fix: resolve authentication bug in user login",
     "Feature: add dark mode toggle to settings",
     "Refactor: improve database connection handling",
@@ -96,8 +96,8 @@ COMMIT_MESSAGES = [
     "Style: format code according to style guide",
     "Test: add unit tests for payment processing",
     "Chore: clean up deprecated configuration files",
-]
-BRANCH_NAMES = [
+)
+BRANCH_NAMES = (
     "main",
     "develop",
     "feature/user-auth",
@@ -105,8 +105,8 @@ BRANCH_NAMES = [
     "bugfix/login-error",
     "hotfix/security-patch",
     "release/v2.1.0",
-]
-USERS = [
+)
+USERS = (
     ("Alice Johnson", "alice.johnson@example.com"),
     ("Bob Smith", "bob.smith@example.com"),
     ("Carol Davis", "carol.davis@example.com"),
@@ -115,4 +115,209 @@ USERS = [
     ("Frank Miller", "frank.miller@example.com"),
     ("Grace Lee", "grace.lee@example.com"),
     ("Henry Taylor", "henry.taylor@example.com"),
-]
+)
+# runners_token is randomised per call
+PROJECT_TEMPLATE = {
+    "id": 3,
+    "description": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+    "description_html": '<p data-sourcepos="1:1-1:56" dir="auto">Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p>',
+    "default_branch": "main",
+    "visibility": "private",
+    "ssh_url_to_repo": "git@example.com:diaspora/diaspora-project-site.git",
+    "http_url_to_repo": "http://example.com/diaspora/diaspora-project-site.git",
+    "web_url": "http://example.com/diaspora/diaspora-project-site",
+    "readme_url": "http://example.com/diaspora/diaspora-project-site/blob/main/README.md",
+    "tag_list": ["example", "disapora project"],
+    "topics": ["example", "disapora project"],
+    "owner": {
+        "id": 3,
+        "name": "Diaspora",
+        "created_at": "2013-09-30T13:46:02Z",
+    },
+    "name": "Diaspora Project Site",
+    "name_with_namespace": "Diaspora / Diaspora Project Site",
+    "path": "diaspora-project-site",
+    "path_with_namespace": "diaspora/diaspora-project-site",
+    "issues_enabled": True,
+    "open_issues_count": 1,
+    "merge_requests_enabled": True,
+    "jobs_enabled": True,
+    "wiki_enabled": True,
+    "snippets_enabled": False,
+    "can_create_merge_request_in": True,
+    "resolve_outdated_diff_discussions": False,
+    "container_registry_enabled": False,
+    "container_registry_access_level": "disabled",
+    "security_and_compliance_access_level": "disabled",
+    "container_expiration_policy": {
+        "cadence": "7d",
+        "enabled": False,
+        "keep_n": None,
+        "older_than": None,
+        "name_regex": None,
+        "name_regex_delete": None,
+        "name_regex_keep": None,
+        "next_run_at": "2020-01-07T21:42:58.658Z",
+    },
+    "created_at": "2013-09-30T13:46:02Z",
+    "updated_at": "2013-09-30T13:46:02Z",
+    "last_activity_at": "2013-09-30T13:46:02Z",
+    "creator_id": 3,
+    "namespace": {
+        "id": 3,
+        "name": "Diaspora",
+        "path": "diaspora",
+        "kind": "group",
+        "full_path": "diaspora",
+        "avatar_url": "http://localhost:3000/uploads/group/avatar/3/foo.jpg",
+        "web_url": "http://localhost:3000/groups/diaspora",
+    },
+    "import_url": None,
+    "import_type": None,
+    "import_status": "none",
+    "import_error": None,
+    "permissions": {
+        "project_access": {"access_level": 10, "notification_level": 3},
+        "group_access": {"access_level": 50, "notification_level": 3},
+    },
+    "archived": False,
+    "avatar_url": "http://example.com/uploads/project/avatar/3/uploads/avatar.png",
+    "license_url": "http://example.com/diaspora/diaspora-client/blob/main/LICENSE",
+    "license": {
+        "key": "lgpl-3.0",
+        "name": "GNU Lesser General Public License v3.0",
+        "nickname": "GNU LGPLv3",
+        "html_url": "http://choosealicense.com/licenses/lgpl-3.0/",
+        "source_url": "http://www.gnu.org/licenses/lgpl-3.0.txt",
+    },
+    "shared_runners_enabled": True,
+    "group_runners_enabled": True,
+    "forks_count": 0,
+    "star_count": 0,
+    "runners_token": None,
+    "ci_default_git_depth": 50,
+    "ci_forward_deployment_enabled": True,
+    "ci_forward_deployment_rollback_allowed": True,
+    "ci_allow_fork_pipelines_to_run_in_parent_project": True,
+    "ci_id_token_sub_claim_components": ["project_path", "ref_type", "ref"],
+    "ci_separated_caches": True,
+    "ci_restrict_pipeline_cancellation_role": "developer",
+    "ci_pipeline_variables_minimum_override_role": "maintainer",
+    "ci_push_repository_for_job_token_allowed": False,
+    "public_jobs": True,
+    "shared_with_groups": [
+        {
+            "group_id": 4,
+            "group_name": "Twitter",
+            "group_full_path": "twitter",
+            "group_access_level": 30,
+        },
+        {
+            "group_id": 3,
+            "group_name": "Gitlab Org",
+            "group_full_path": "gitlab-org",
+            "group_access_level": 10,
+        },
+    ],
+    "repository_storage": "default",
+    "only_allow_merge_if_pipeline_succeeds": False,
+    "allow_merge_on_skipped_pipeline": False,
+    "allow_pipeline_trigger_approve_deployment": False,
+    "restrict_user_defined_variables": False,
+    "only_allow_merge_if_all_discussions_are_resolved": False,
+    "remove_source_branch_after_merge": False,
+    "printing_merge_requests_link_enabled": True,
+    "request_access_enabled": False,
+    "merge_method": "merge",
+    "squash_option": "default_on",
+    "auto_devops_enabled": True,
+    "auto_devops_deploy_strategy": "continuous",
+    "approvals_before_merge": 0,
+    "mirror": False,
+    "mirror_user_id": 45,
+    "mirror_trigger_builds": False,
+    "only_mirror_protected_branches": False,
+    "mirror_overwrites_diverged_branches": False,
+    "external_authorization_classification_label": None,
+    "packages_enabled": True,
+    "service_desk_enabled": False,
+    "service_desk_address": None,
+    "autoclose_referenced_issues": True,
+    "suggestion_commit_message": None,
+    "enforce_auth_checks_on_uploads": True,
+    "merge_commit_template": None,
+    "squash_commit_template": None,
+    "issue_branch_template": "gitlab/%{id}-%{title}",
+    "marked_for_deletion_at": "2020-04-03",
+    "marked_for_deletion_on": "2020-04-03",
+    "compliance_frameworks": ["sox"],
+    "warn_about_potentially_unwanted_characters": True,
+    "secret_push_protection_enabled": False,
+    "statistics": {
+        "commit_count": 37,
+        "storage_size": 1038090,
+        "repository_size": 1038090,
+        "wiki_size": 0,
+        "lfs_objects_size": 0,
+        "job_artifacts_size": 0,
+        "pipeline_artifacts_size": 0,
+        "packages_size": 0,
+        "snippets_size": 0,
+        "uploads_size": 0,
+        "container_registry_size": 0,
+    },
+    "container_registry_image_prefix": "registry.example.com/diaspora/diaspora-client",
+    "_links": {
+        "self": "http://example.com/api/v4/projects",
+        "issues": "http://example.com/api/v4/projects/1/issues",
+        "merge_requests": "http://example.com/api/v4/projects/1/merge_requests",
+        "repo_branches": "http://example.com/api/v4/projects/1/repository_branches",
+        "labels": "http://example.com/api/v4/projects/1/labels",
+        "events": "http://example.com/api/v4/projects/1/events",
+        "members": "http://example.com/api/v4/projects/1/members",
+        "cluster_agents": "http://example.com/api/v4/projects/1/cluster_agents",
+    },
+    "spp_repository_pipeline_access": False,
+}
+# sha and before_sha are randomised per call
+PIPELINE_DETAILS_TEMPLATE = {
+    "id": 287,
+    "iid": 144,
+    "project_id": 21,
+    "name": "Build pipeline",
+    "sha": None,
+    "ref": "main",
+    "status": "success",
+    "source": "push",
+    "created_at": "2022-09-21T01:05:07.200Z",
+    "updated_at": "2022-09-21T01:05:50.185Z",
+    "web_url": "http://127.0.0.1:3000/test-group/test-project/-/pipelines/287",
+    "before_sha": None,
+    "tag": False,
+    "yaml_errors": None,
+    "user": {
+        "id": 1,
+        "username": "root",
+        "name": "Administrator",
+        "state": "active",
+        "avatar_url": "https://www.gravatar.com/avatar/e64c7d89f26bd1972efa854d13d7dd61?s=80&d=identicon",
+        "web_url": "http://127.0.0.1:3000/root",
+    },
+    "started_at": "2022-09-21T01:05:14.197Z",
+    "finished_at": "2022-09-21T01:05:50.175Z",
+    "committed_at": None,
+    "duration": 34,
+    "queued_duration": 6,
+    "coverage": None,
+    "detailed_status": {
+        "icon": "status_success",
+        "text": "passed",
+        "label": "passed",
+        "group": "success",
+        "tooltip": "passed",
+        "has_details": False,
+        "details_path": "/test-group/test-project/-/pipelines/287",
+        "illustration": None,
+        "favicon": "/assets/ci_favicons/favicon_status_success-8451333011eee8ce9f2ab25dc487fe24a8758c694827a582f17f42b0a90446a2.png",
+    },
+}
@@ -1,8 +1,10 @@
 import asyncio
-import os
-from logging import Formatter, Handler, Logger
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from logging import DEBUG, Formatter, Handler, Logger
 from typing import Optional
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
@@ -10,12 +12,17 @@ from textual.events import Key
 from textual.message import Message
 from textual.reactive import reactive
 from textual.theme import Theme
+from textual.timer import Timer
 from textual.widgets import Footer, Header, RichLog, TabbedContent, TabPane
 
 from gitlab_tui.api.client import GitlabAPI, GitLabAPIError
 from gitlab_tui.config.config import Config
 from gitlab_tui.ui.components.pipeline_main_view import PipelineMainView
 from gitlab_tui.ui.components.pipeline_sidebar import PipelineSidebar
+from gitlab_tui.utils.env import env_flag
+
+_DEBUG = env_flag("DEBUG")
+_DEBUG_KEYS = env_flag("DEBUG_KEYS")
 
 
 class GitLabTUI(App):
@@ -41,6 +48,24 @@ class GitLabTUI(App):
         # Quick help
         Binding("?", "show_help", "Show help"),
     ]
+    _BINDING_BY_KEY: dict[str, Binding] = {b.key: b for b in BINDINGS}
+
+    _HELP_TEXT = """\
+GitLab TUI - Keyboard Shortcuts
+
+Navigation:
+  h/l     - Focus left/right panel
+  j/k     - Move up/down
+  gg/G    - Go to top/bottom
+  tab     - Next focus
+
+Actions:
+  enter   - Select pipeline
+  r       - Refresh data
+  q       - Quit
+  d       - Toggle dark mode
+  ctrl+shift+d - Toggle debug panel
+  ?       - This help"""
 
     # Reactive attributes
     selected_pipeline_id: reactive[Optional[int]] = reactive(None)
@@ -61,15 +86,25 @@ class GitLabTUI(App):
         self.logger = logger
 
         # Setup debug mode
-        self.debug_mode = os.getenv("DEBUG", "").lower() in ("true", "1", "yes")
-        self.debug_keys = os.getenv("DEBUG_KEYS", "").lower() in ("true", "1", "yes")
+        self.debug_mode = _DEBUG
+        self.debug_keys = _DEBUG_KEYS
         self.debug_panel_visible = self.debug_mode
 
         self.gitlab_api = gitlab_api
+        # Dedicated pool for blocking API calls, kept apart from the default
+        # executor that Textual and asyncio also use
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.app.max_parallel_requests,
+            thread_name_prefix="gitlab-io",
+        )
         self.project = project  # Can be ID (int) or path (str)
         self.branch = branch
         self.pipelines_data: list = []
         self.current_pipeline_jobs: list = []
+        self._jobs_cache: dict[int, list] = {}
+        self._refresh_event = asyncio.Event()
+        self._rich_log_handler: Optional[Handler] = None
+        self._rich_log_timer: Optional[Timer] = None
         self.logger.info(
             f"GitLab TUI starting - Debug mode: {self.debug_mode}, Debug keys: {self.debug_keys}"
         )
@@ -105,34 +140,52 @@ class GitLabTUI(App):
         self._setup_rich_log_handler()
         self._setup_debug_logging()
 
-        theme = Theme(**self.config.theme.__dict__)
+        theme = Theme(**self.config.theme.to_theme_kwargs())
         self.register_theme(theme)
         self.theme = self.config.theme.name
 
         await self.load_initial_data()
+        self._auto_refresh_loop()
 
     def _setup_rich_log_handler(self) -> None:
         """Setup RichLog handler for live debug output."""
         debug_log = self.query_one("#debug-log", RichLog)
 
-        # Create custom handler that writes to RichLog
+        # Create custom handler that buffers records and writes them to RichLog
+        # in batches, so a burst of records costs one render instead of many
         class RichLogHandler(Handler):
             def __init__(self, rich_log_widget):
                 super().__init__()
                 self.rich_log = rich_log_widget
+                self._buffer: deque[str] = deque(maxlen=1000)
 
             def emit(self, record):
                 try:
-                    msg = self.format(record)
-                    self.rich_log.write(msg)
+                    self._buffer.append(self.format(record))
+                except Exception:
+                    pass  # nosec B110 Ignore errors in logging
+
+            def flush(self):
+                if not self._buffer:
+                    return
+                lines = []
+                while self._buffer:
+                    lines.append(self._buffer.popleft())
+                try:
+                    self.rich_log.write("\n".join(lines))
                 except Exception:
                     pass  # nosec B110 Ignore errors in logging
 
-        # Add RichLog handler to logger
+        # Add RichLog handler to logger and flush it at 20 Hz while the debug
+        # panel is shown; while hidden, records wait in the bounded buffer
         rich_handler = RichLogHandler(debug_log)
         rich_formatter = Formatter("%(levelname)s - %(message)s")
         rich_handler.setFormatter(rich_formatter)
         self.logger.addHandler(rich_handler)
+        self._rich_log_handler = rich_handler
+        self._rich_log_timer = self.set_interval(
+            0.05, rich_handler.flush, pause=not self.debug_panel_visible
+        )
 
     def _setup_debug_logging(self) -> None:
         """Setup debug logging for navigation actions."""
@@ -140,9 +193,9 @@ class GitLabTUI(App):
             self.logger.debug("Debug mode enabled - logging all actions")
 
     def on_key(self, event: Key) -> None:
-        """Log all key presses for debugging (only if DEBUG_KEYS=true)."""
-        if not self.debug_keys:
-            return  # Skip all key logging unless DEBUG_KEYS is enabled
+        """Log all key presses for debugging when DEBUG_KEYS=true."""
+        if not _DEBUG_KEYS or not self._log_keys():
+            return  # Skip all key logging unless DEBUG logging is enabled
 
         focused_widget = self.focused
         focused_name = focused_widget.__class__.__name__ if focused_widget else "None"
@@ -151,40 +204,57 @@ class GitLabTUI(App):
         )
 
         self.logger.debug(
-            f"Key pressed: '{event.key}' (focused: {focused_name}#{focused_id})"
+            "Key pressed: '%s' (focused: %s#%s)", event.key, focused_name, focused_id
         )
 
         # Log if key has a binding
-        for binding in self.BINDINGS:
-            if binding.key == event.key:
-                self.logger.debug(
-                    f"Key '{event.key}' has binding: {binding.action} ({binding.description})"
-                )
-                break
+        binding = self._BINDING_BY_KEY.get(event.key)
+        if binding is not None:
+            self.logger.debug(
+                "Key '%s' has binding: %s (%s)",
+                event.key,
+                binding.action,
+                binding.description,
+            )
         else:
-            self.logger.debug(f"Key '{event.key}' has no binding")
+            self.logger.debug("Key '%s' has no binding", event.key)
+
+    def _log_keys(self) -> bool:
+        """Whether key/navigation debug messages would actually be emitted."""
+        return self.debug_keys and self.logger.isEnabledFor(DEBUG)
 
     async def load_initial_data(self) -> None:
         """Load initial pipeline data."""
         self.logger.info(f"Loading initial data for project: {self.project}")
         self.loading = True
         self.error_message = None
+        loop = asyncio.get_running_loop()
+
+        # Project info is only used for the subtitle, so fetch pipeline data
+        # alongside it rather than after it
+        self.logger.debug("Fetching pipeline data")
+        pipelines_task = asyncio.create_task(self._load_pipelines())
 
         try:
             # Test connection and get project info
             self.logger.debug(f"Fetching project info for: {self.project}")
-            project_info = await asyncio.get_event_loop().run_in_executor(
-                None, self.gitlab_api.get_project, self.project
-            )
+            try:
+                project_info = await loop.run_in_executor(
+                    self._executor, self.gitlab_api.get_project, self.project
+                )
+            except Exception:
+                # Let the pipeline load finish rather than cutting it off
+                # mid-mount; its error is the same connection failure, so
+                # only the project error below is reported
+                await asyncio.gather(pipelines_task, return_exceptions=True)
+                raise
             project_name = project_info.get("name", "Unknown Project")
             self.logger.info(
                 f"Connected to project: {project_name} (ID: {project_info.get('id')})"
             )
             self.sub_title = f"Pipeline Viewer - {project_name}"
 
-            # Get pipeline data
-            self.logger.debug("Fetching pipeline data")
-            await self.refresh_pipelines()
+            await pipelines_task
 
         except GitLabAPIError as e:
             self.logger.error(f"GitLab API error during initialization: {e}")
@@ -199,40 +269,9 @@ class GitLabTUI(App):
             self.logger.debug("Initial data loading complete")
 
     async def refresh_pipelines(self) -> None:
-        """Refresh pipeline data from GitLab API."""
-        self.logger.debug(
-            f"Refreshing pipelines for project {self.project}, branch: {self.branch}"
-        )
+        """Refresh pipeline data from GitLab API, reporting any error."""
         try:
-            pipelines = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.gitlab_api.get_pipelines,
-                self.project,
-                self.branch,
-                10,
-            )
-            self.logger.info(f"Retrieved {len(pipelines)} pipelines")
-            self.pipelines_data = pipelines
-
-            # Log pipeline details
-            for i, pipeline in enumerate(pipelines[:3]):  # Log first 3 for brevity
-                self.logger.debug(
-                    f"Pipeline {i+1}: ID={pipeline.get('id')}, status={pipeline.get('status')}, ref={pipeline.get('ref')}"
-                )
-
-            # Update sidebar with new data
-            self.logger.debug("Updating sidebar with pipeline data")
-            sidebar = self.query_one("#pipeline-sidebar", PipelineSidebar)
-            await sidebar.update_pipelines(pipelines)
-
-            # Auto-select first pipeline if none selected
-            if pipelines and not self.selected_pipeline_id:
-                first_pipeline_id = pipelines[0]["id"]
-                self.logger.info(f"Auto-selecting first pipeline: {first_pipeline_id}")
-                await self.select_pipeline(first_pipeline_id)
-            elif not pipelines:
-                self.logger.warning("No pipelines found")
-
+            await self._load_pipelines()
         except GitLabAPIError as e:
             self.logger.error(f"GitLab API error refreshing pipelines: {e}")
             self.error_message = str(e)
@@ -242,32 +281,102 @@ class GitLabTUI(App):
             self.error_message = str(e)
             self.notify(f"Unexpected error refreshing pipelines: {e}", severity="error")
 
+    async def _load_pipelines(self) -> None:
+        """Fetch pipelines and their jobs, then show them in the sidebar.
+
+        Raises:
+            GitLabAPIError: If the pipelines can't be fetched
+        """
+        self.logger.debug(
+            f"Refreshing pipelines for project {self.project}, branch: {self.branch}"
+        )
+        loop = asyncio.get_running_loop()
+        pipelines = await loop.run_in_executor(
+            self._executor,
+            self.gitlab_api.get_pipelines,
+            self.project,
+            self.branch,
+            10,
+        )
+        self.logger.info(f"Retrieved {len(pipelines)} pipelines")
+        self.pipelines_data = pipelines
+
+        # Prefetch jobs for every pipeline concurrently so selection is instant
+        jobs_list = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._executor,
+                    self.gitlab_api.get_pipeline_jobs,
+                    self.project,
+                    pipeline["id"],
+                    self.config.app.per_page,
+                )
+                for pipeline in pipelines
+            ),
+            return_exceptions=True,
+        )
+        self._jobs_cache = {
+            pipeline["id"]: jobs
+            for pipeline, jobs in zip(pipelines, jobs_list)
+            if not isinstance(jobs, BaseException)
+        }
+        self.logger.debug(
+            f"Prefetched jobs for {len(self._jobs_cache)}/{len(pipelines)} pipelines"
+        )
+
+        # Log pipeline details
+        for i, pipeline in enumerate(pipelines[:3]):  # Log first 3 for brevity
+            self.logger.debug(
+                f"Pipeline {i+1}: ID={pipeline.get('id')}, status={pipeline.get('status')}, ref={pipeline.get('ref')}"
+            )
+
+        # Update sidebar with new data
+        self.logger.debug("Updating sidebar with pipeline data")
+        sidebar = self.query_one("#pipeline-sidebar", PipelineSidebar)
+        await sidebar.update_pipelines(pipelines)
+
+        # Auto-select first pipeline if none selected, otherwise keep the
+        # selected pipeline's jobs in step with the refreshed list
+        selected_pipeline_id = self.selected_pipeline_id
+        if not pipelines:
+            self.logger.warning("No pipelines found")
+        elif not selected_pipeline_id:
+            first_pipeline_id = pipelines[0]["id"]
+            self.logger.info(f"Auto-selecting first pipeline: {first_pipeline_id}")
+            await self.select_pipeline(first_pipeline_id)
+        else:
+            await self.select_pipeline(selected_pipeline_id)
+
     async def select_pipeline(self, pipeline_id: int) -> None:
         """Select a pipeline and load its job data."""
         self.logger.info(f"Selecting pipeline: {pipeline_id}")
         self.selected_pipeline_id = pipeline_id
+        loop = asyncio.get_running_loop()
 
         try:
-            # Get pipeline jobs
-            self.logger.debug(f"Fetching jobs for pipeline {pipeline_id}")
-            jobs = await asyncio.get_event_loop().run_in_executor(
-                None, self.gitlab_api.get_pipeline_jobs, self.project, pipeline_id
-            )
+            # Get pipeline jobs, preferring those prefetched by refresh_pipelines
+            if pipeline_id in self._jobs_cache:
+                jobs = self._jobs_cache[pipeline_id]
+            else:
+                self.logger.debug(f"Fetching jobs for pipeline {pipeline_id}")
+                jobs = await loop.run_in_executor(
+                    self._executor,
+                    self.gitlab_api.get_pipeline_jobs,
+                    self.project,
+                    pipeline_id,
+                    self.config.app.per_page,
+                )
+                self._jobs_cache[pipeline_id] = jobs
             self.logger.info(f"Retrieved {len(jobs)} jobs for pipeline {pipeline_id}")
             self.current_pipeline_jobs = jobs
 
             # Log job details
-            job_summary: dict = {}
-            for job in jobs:
-                stage = job.get("stage", "unknown")
-                status = job.get("status", "unknown")
-                if stage not in job_summary:
-                    job_summary[stage] = {}
-                if status not in job_summary[stage]:
-                    job_summary[stage][status] = 0
-                job_summary[stage][status] += 1
-
-            self.logger.debug(f"Job summary: {job_summary}")
+            if self.logger.isEnabledFor(DEBUG):
+                job_summary = Counter(
+                    (job.get("stage", "unknown"), job.get("status", "unknown"))
+                    for job in jobs
+                )
+                self.logger.debug(f"Job summary: {dict(job_summary)}")
 
             # Update main view with job data
             self.logger.debug("Updating main view with job data")
@@ -294,37 +403,49 @@ class GitLabTUI(App):
             "textual-dark" if self.theme == "textual-light" else "textual-light"
         )
 
+    @work(exclusive=True, group="auto-refresh")
+    async def _auto_refresh_loop(self) -> None:
+        """Refresh pipelines every auto_refresh seconds, or as soon as requested."""
+        interval = self.config.app.auto_refresh
+        timeout = interval if interval > 0 else None
+        while True:
+            try:
+                await asyncio.wait_for(self._refresh_event.wait(), timeout=timeout)
+            except TimeoutError:
+                self.logger.debug("Auto refresh triggered")
+            self._refresh_event.clear()
+            await self.refresh_pipelines()
+
     async def action_refresh(self) -> None:
         """Refresh all data."""
         self.logger.info("Refresh action triggered")
         self.notify("Refreshing data...")
-        await self.refresh_pipelines()
+        self._refresh_event.set()
 
     async def action_quit(self) -> None:
         """Quit the application."""
         self.logger.info("Quit action triggered")
+        self._executor.shutdown(wait=False, cancel_futures=True)
         self.exit()
 
     def action_focus_left(self) -> None:
         """Smart left action: widget navigation or panel focus."""
-        if self.debug_keys:
+        if self._log_keys():
             self.logger.debug("Focus left action triggered")
         focused = self.focused
 
         # If we're in a widget that handles left/right internally, let it handle it
-        if focused and hasattr(focused, "action_cursor_left"):
-            if self.debug_keys:
-                self.logger.debug(
-                    f"Widget {focused.__class__.__name__} can handle cursor_left, delegating"
-                )
-            focused.action_cursor_left()
-            return
-        elif focused and hasattr(focused, "cursor_left"):
-            if self.debug_keys:
+        cursor_left = focused and (
+            getattr(focused, "action_cursor_left", None)
+            or getattr(focused, "cursor_left", None)
+        )
+        if cursor_left:
+            if self._log_keys():
                 self.logger.debug(
-                    f"Widget {focused.__class__.__name__} can handle cursor_left, delegating"
+                    "Widget %s can handle cursor_left, delegating",
+                    focused.__class__.__name__,
                 )
-            focused.cursor_left()
+            cursor_left()
             return
 
         # Otherwise, do panel navigation (focus sidebar)
@@ -334,35 +455,33 @@ class GitLabTUI(App):
             if focused and (
                 focused == sidebar or sidebar in focused.ancestors_with_self
             ):
-                if self.debug_keys:
+                if self._log_keys():
                     self.logger.debug("Already in sidebar, no action needed")
                 return
             sidebar.focus()
-            if self.debug_keys:
+            if self._log_keys():
                 self.logger.debug("Focused sidebar successfully")
         except Exception as e:
             self.logger.error(f"Failed to focus sidebar: {e}")
 
     def action_focus_right(self) -> None:
         """Smart right action: widget navigation or panel focus."""
-        if self.debug_keys:
+        if self._log_keys():
             self.logger.debug("Focus right action triggered")
         focused = self.focused
 
         # If we're in a widget that handles left/right internally, let it handle it
-        if focused and hasattr(focused, "action_cursor_right"):
-            if self.debug_keys:
-                self.logger.debug(
-                    f"Widget {focused.__class__.__name__} can handle cursor_right, delegating"
-                )
-            focused.action_cursor_right()
-            return
-        elif focused and hasattr(focused, "cursor_right"):
-            if self.debug_keys:
+        cursor_right = focused and (
+            getattr(focused, "action_cursor_right", None)
+            or getattr(focused, "cursor_right", None)
+        )
+        if cursor_right:
+            if self._log_keys():
                 self.logger.debug(
-                    f"Widget {focused.__class__.__name__} can handle cursor_right, delegating"
+                    "Widget %s can handle cursor_right, delegating",
+                    focused.__class__.__name__,
                 )
-            focused.cursor_right()
+            cursor_right()
             return
 
         # Otherwise, do panel navigation (focus main view)
@@ -372,11 +491,11 @@ class GitLabTUI(App):
             if focused and (
                 focused == main_view or main_view in focused.ancestors_with_self
             ):
-                if self.debug_keys:
+                if self._log_keys():
                     self.logger.debug("Already in main view, no action needed")
                 return
             main_view.focus()
-            if self.debug_keys:
+            if self._log_keys():
                 self.logger.debug("Focused main view successfully")
         except Exception as e:
             self.logger.error(f"Failed to focus main view: {e}")
@@ -387,23 +506,25 @@ class GitLabTUI(App):
             self.logger.info("UP action triggered (from 'k' key)")
         focused = self.focused
         if focused:
-            if self.debug_keys:
+            if self._log_keys():
                 self.logger.debug(
-                    f"Calling cursor_up on focused widget: {focused.__class__.__name__}"
+                    "Calling cursor_up on focused widget: %s",
+                    focused.__class__.__name__,
                 )
             # Call the widget's cursor_up method directly
             if hasattr(focused, "action_cursor_up"):
                 focused.action_cursor_up()
-                if self.debug_keys:
+                if self._log_keys():
                     self.logger.debug("Successfully called action_cursor_up")
             elif hasattr(focused, "cursor_up"):
                 focused.cursor_up()
-                if self.debug_keys:
+                if self._log_keys():
                     self.logger.debug("Successfully called cursor_up")
             else:
                 if self.debug_keys:
                     self.logger.warning(
-                        f"Widget {focused.__class__.__name__} has no cursor_up method"
+                        "Widget %s has no cursor_up method",
+                        focused.__class__.__name__,
                     )
         else:
             if self.debug_keys:
@@ -415,23 +536,25 @@ class GitLabTUI(App):
             self.logger.info("DOWN action triggered (from 'j' key)")
         focused = self.focused
         if focused:
-            if self.debug_keys:
+            if self._log_keys():
                 self.logger.debug(
-                    f"Calling cursor_down on focused widget: {focused.__class__.__name__}"
+                    "Calling cursor_down on focused widget: %s",
+                    focused.__class__.__name__,
                 )
             # Call the widget's cursor_down method directly
             if hasattr(focused, "action_cursor_down"):
                 focused.action_cursor_down()
-                if self.debug_keys:
+                if self._log_keys():
                     self.logger.debug("Successfully called action_cursor_down")
             elif hasattr(focused, "cursor_down"):
                 focused.cursor_down()
-                if self.debug_keys:
+                if self._log_keys():
                     self.logger.debug("Successfully called cursor_down")
             else:
                 if self.debug_keys:
                     self.logger.warning(
-                        f"Widget {focused.__class__.__name__} has no cursor_down method"
+                        "Widget %s has no cursor_down method",
+                        focused.__class__.__name__,
                     )
         else:
             if self.debug_keys:
@@ -445,30 +568,19 @@ class GitLabTUI(App):
         if self.debug_panel_visible:
             debug_log.remove_class("hidden")
             self.logger.info("Debug panel shown")
+            if self._rich_log_handler is not None:
+                self._rich_log_handler.flush()
+            if self._rich_log_timer is not None:
+                self._rich_log_timer.resume()
         else:
             debug_log.add_class("hidden")
             self.logger.info("Debug panel hidden")
+            if self._rich_log_timer is not None:
+                self._rich_log_timer.pause()
 
     def action_show_help(self) -> None:
         """Show help overlay with keyboard shortcuts."""
-        help_text = """
-GitLab TUI - Keyboard Shortcuts
-
-Navigation:
-  h/l     - Focus left/right panel
-  j/k     - Move up/down
-  gg/G    - Go to top/bottom
-  tab     - Next focus
-
-Actions:
-  enter   - Select pipeline
-  r       - Refresh data
-  q       - Quit
-  d       - Toggle dark mode
-  ctrl+shift+d - Toggle debug panel
-  ?       - This help
-        """
-        self.notify(help_text.strip())
+        self.notify(self._HELP_TEXT)
 
     # Message handlers for custom events
     class PipelineSelected(Message):
@@ -1,7 +1,7 @@
 """Main configuration class for GitLab TUI application."""
 
+from functools import cached_property
 from logging import Logger
-from typing import Optional
 
 from gitlab_tui.config.config_reader import ConfigReader
 from gitlab_tui.config.credentials_reader import CredentialsManager
@@ -16,8 +16,8 @@ class Config:
         config = Config(logger)
 
         # Git context
-        url = config.git.get_remote_url()
-        domain = config.git.get_domain()
+        url = config.git.remote_url
+        domain = config.git.domain
 
         # App configuration
         theme = config.app.theme
@@ -32,59 +32,39 @@ class Config:
         background = config.theme.background
 
         # Credentials
-        token = config.credentials.get_token()
+        token = config.credentials.token
     """
 
     def __init__(self, logger: Logger):
         self.logger = logger
-        self._git: Optional[GitContextResolver] = None
-        self._config_reader: Optional[ConfigReader] = None
-        self._app: Optional[AppConfig] = None
-        self._icons: Optional[IconsConfig] = None
-        self._theme: Optional[ThemeConfig] = None
-        self._credentials: Optional[CredentialsManager] = None
-
-    @property
+
+    @cached_property
     def git(self) -> GitContextResolver:
         """Get the Git context resolver."""
-        if self._git is None:
-            self._git = GitContextResolver(self.logger)
-        return self._git
+        return GitContextResolver(self.logger)
 
-    @property
+    @cached_property
     def app(self) -> AppConfig:
         """Get the App configuration."""
-        if self._app is None:
-            config_reader = self._get_config_reader()
-            self._app = config_reader.get_app_config()
-        return self._app
+        return self._config_reader.app_config
 
-    @property
+    @cached_property
     def icons(self) -> IconsConfig:
         """Get the Icons configuration."""
-        if self._icons is None:
-            config_reader = self._get_config_reader()
-            self._icons = config_reader.get_icons_config()
-        return self._icons
+        return self._config_reader.icons_config
 
-    @property
+    @cached_property
     def theme(self) -> ThemeConfig:
         """Get the Theme configuration."""
-        if self._theme is None:
-            config_reader = self._get_config_reader()
-            self._theme = config_reader.get_theme_config()
-        return self._theme
+        return self._config_reader.theme_config
 
-    @property
+    @cached_property
     def credentials(self) -> CredentialsManager:
         """Get the Credentials manager."""
-        if self._credentials is None:
-            domain = self.git.get_domain()
-            self._credentials = CredentialsManager(self.logger, domain)
-        return self._credentials
-
-    def _get_config_reader(self) -> ConfigReader:
-        """Get the config reader (shared between app, icons, and theme)."""
-        if self._config_reader is None:
-            self._config_reader = ConfigReader(self.logger)
-        return self._config_reader
+        domain = self.git.domain
+        return CredentialsManager(self.logger, domain)
+
+    @cached_property
+    def _config_reader(self) -> ConfigReader:
+        """Config reader shared between app, icons, and theme."""
+        return ConfigReader(self.logger)
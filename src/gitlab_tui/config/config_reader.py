@@ -1,60 +1,97 @@
-import tomllib
+import os
+from dataclasses import replace
+from functools import cached_property
 from logging import Logger
-from pathlib import Path
-from typing import Optional
+from typing import TypeVar
 
 from gitlab_tui.config.defaults import (
+    DEFAULT_APP_CONFIG,
+    DEFAULT_ICONS_CONFIG,
+    DEFAULT_THEME_CONFIG,
     AppConfig,
     IconsConfig,
     ThemeConfig,
 )
+from gitlab_tui.config.paths import CONFIG_DIR
+
+# Parsed config files keyed by path, along with the (mtime, size) they were read at
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int], dict]] = {}
+
+
+_ConfigT = TypeVar("_ConfigT", AppConfig, IconsConfig, ThemeConfig)
+
+
+def _overlay(default: _ConfigT, section: dict) -> _ConfigT:
+    """Apply a config file section over the shared defaults.
+
+    Returns the defaults themselves when the section is missing or empty.
+    """
+    return replace(default, **section) if section else default
 
 
 class ConfigReader:
     """Manages reading the configuration"""
 
-    CONFIG_DIR = Path.home() / ".config" / "gitlab-tui"
+    CONFIG_DIR = CONFIG_DIR
     CONFIG_FILE_NAME = "config.toml"
 
     def __init__(self, logger: Logger):
         self.logger = logger
         self.config_file = self.CONFIG_DIR / self.CONFIG_FILE_NAME
-        self._app_config: Optional[AppConfig] = None
-        self._icons_config: Optional[IconsConfig] = None
-        self._theme_config: Optional[ThemeConfig] = None
+
+    @cached_property
+    def _data(self) -> dict:
+        """The parsed config file, read on first use."""
+        return self._read_config_file()
 
     def _load_config(self) -> dict:
-        """Load configuration from file
+        """Load configuration from file, parsing it only once
 
         Returns:
             Configuration data dictionary
         """
-        if self.config_file.exists():
-            with open(self.config_file, "rb") as f:
-                return tomllib.load(f)
-        else:
+        return self._data
+
+    def _read_config_file(self) -> dict:
+        """Read and parse the config file, reusing an earlier parse if unchanged
+
+        Returns:
+            Configuration data dictionary, empty if the file doesn't exist
+            or has no content
+        """
+        try:
+            fd = os.open(self.config_file, os.O_RDONLY)
+        except FileNotFoundError:
             return {}
 
-    def get_app_config(self) -> AppConfig:
-        """Get the App configuration"""
-        if self._app_config is None:
-            data = self._load_config()
-            app_config_data = data.get("app", {})
-            self._app_config = AppConfig(**app_config_data)
-        return self._app_config
-
-    def get_icons_config(self) -> IconsConfig:
-        """Get the Icons configuration"""
-        if self._icons_config is None:
-            data = self._load_config()
-            icons_config_data = data.get("icons", {})
-            self._icons_config = IconsConfig(**icons_config_data)
-        return self._icons_config
-
-    def get_theme_config(self) -> ThemeConfig:
-        """Get the Theme configuration"""
-        if self._theme_config is None:
-            data = self._load_config()
-            theme_config_data = data.get("theme", {})
-            self._theme_config = ThemeConfig(**theme_config_data)
-        return self._theme_config
+        with os.fdopen(fd, "rb") as f:
+            stat = os.fstat(fd)
+            if stat.st_size == 0:
+                return {}
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cache_key = str(self.config_file)
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            # Imported here so runs without a config file never load tomllib
+            import tomllib
+
+            data = tomllib.load(f)
+
+        _CONFIG_CACHE[cache_key] = (signature, data)
+        return data
+
+    @cached_property
+    def app_config(self) -> AppConfig:
+        """The App configuration"""
+        return _overlay(DEFAULT_APP_CONFIG, self._load_config().get("app", {}))
+
+    @cached_property
+    def icons_config(self) -> IconsConfig:
+        """The Icons configuration"""
+        return _overlay(DEFAULT_ICONS_CONFIG, self._load_config().get("icons", {}))
+
+    @cached_property
+    def theme_config(self) -> ThemeConfig:
+        """The Theme configuration"""
+        return _overlay(DEFAULT_THEME_CONFIG, self._load_config().get("theme", {}))
@@ -1,24 +1,52 @@
 """Credentials manager for GitLab TUI."""
 
-import tomllib
+import os
+from functools import cached_property
 from logging import Logger
-from pathlib import Path
-from typing import Optional
 
+from gitlab_tui.config.paths import CONFIG_DIR
 from gitlab_tui.utils.exceptions import ConfigError
 
+# Parsed credentials files keyed by path, along with the (mtime, size) they were read at
+_CREDENTIALS_CACHE: dict[str, tuple[tuple[int, int], dict]] = {}
+
+# Error message templates, filled in with the path or domain when raised
+_ERR_NO_FILE = (
+    "Credentials file not found at {path}\n\n"
+    "Expected format (use quotes around domains with dots):\n"
+    '["gitlab.com"]\n'
+    'token = "your_token_here"'
+)
+_ERR_PARSE = (
+    "Failed to parse credentials file: {path}\n\n"
+    "Expected TOML format:\n"
+    '["gitlab.com"]\n'
+    'token = "your_token_here"'
+)
+_ERR_NO_DOMAIN = (
+    "No configuration found for '{domain}'\n\n"
+    "Expected format:\n"
+    '["{domain}"]\n'
+    'token = "your_token_here"'
+)
+_ERR_NO_TOKEN = (
+    "No token found for '{domain}'\n\n"
+    "Expected format:\n"
+    '["{domain}"]\n'
+    'token = "your_token_here"'
+)
+
 
 class CredentialsManager:
     """Manages reading the defined credentials"""
 
-    CONFIG_DIR = Path.home() / ".config" / "gitlab-tui"
+    CONFIG_DIR = CONFIG_DIR
     CREDENTIALS_FILE_NAME = "credentials"
 
     def __init__(self, logger: Logger, domain: str):
         self.logger = logger
         self.credentials_file = self.CONFIG_DIR / self.CREDENTIALS_FILE_NAME
         self.domain = domain
-        self._token: Optional[str] = None
 
     def _load_token(self) -> str:
         """Load token from credentials file.
@@ -29,54 +57,45 @@ class CredentialsManager:
         Raises:
             ConfigError: If file doesn't exist or token not found
         """
-        if not self.credentials_file.exists():
-            self.logger.error(f"Credentials file not found: {self.credentials_file}")
-            raise ConfigError(
-                f"Credentials file not found at {self.credentials_file}\n\n"
-                f"Expected format (use quotes around domains with dots):\n"
-                f'["gitlab.com"]\n'
-                f'token = "your_token_here"'
-            )
-
         try:
-            with open(self.credentials_file, "rb") as f:
-                data = tomllib.load(f)
-        except Exception as e:
-            raise ConfigError(
-                f"Failed to parse credentials file: {self.credentials_file}\n\n"
-                f"Expected TOML format:\n"
-                f'["gitlab.com"]\n'
-                f'token = "your_token_here"'
-            ) from e
+            fd = os.open(self.credentials_file, os.O_RDONLY)
+        except FileNotFoundError:
+            self.logger.error(f"Credentials file not found: {self.credentials_file}")
+            raise ConfigError(_ERR_NO_FILE.format(path=self.credentials_file)) from None
+
+        with os.fdopen(fd, "rb") as f:
+            # Taken from the open file, so the signature matches what is parsed
+            stat = os.fstat(fd)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cache_key = str(self.credentials_file)
+            cached = _CREDENTIALS_CACHE.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                data = cached[1]
+            else:
+                # Imported here so cached loads never need tomllib
+                import tomllib
+
+                try:
+                    data = tomllib.load(f)
+                except Exception as e:
+                    raise ConfigError(
+                        _ERR_PARSE.format(path=self.credentials_file)
+                    ) from e
+                _CREDENTIALS_CACHE[cache_key] = (signature, data)
 
         domain_config = data.get(self.domain)
 
         if not domain_config:
-            raise ConfigError(
-                f"No configuration found for '{self.domain}'\n\n"
-                f"Expected format:\n"
-                f'["{self.domain}"]\n'
-                f'token = "your_token_here"'
-            )
+            raise ConfigError(_ERR_NO_DOMAIN.format(domain=self.domain))
 
         token = domain_config.get("token")
 
         if not token:
-            raise ConfigError(
-                f"No token found for '{self.domain}'\n\n"
-                f"Expected format:\n"
-                f'["{self.domain}"]\n'
-                f'token = "your_token_here"'
-            )
+            raise ConfigError(_ERR_NO_TOKEN.format(domain=self.domain))
 
         return token
 
-    def get_token(self) -> str:
-        """Get GitLab token for the configured domain.
-
-        Returns:
-            GitLab personal access token
-        """
-        if self._token is None:
-            self._token = self._load_token()
-        return self._token
+    @cached_property
+    def token(self) -> str:
+        """GitLab personal access token for the configured domain."""
+        return self._load_token()
@@ -1,17 +1,47 @@
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
+# Read-only default theme variables, shared by all default ThemeConfigs
+_DEFAULT_THEME_VARIABLES: Mapping[str, str] = MappingProxyType(
+    {
+        "block-cursor-text-style": "none",
+        "footer-key-foreground": "#cba6f7",  # Mauve for footer keys
+        "input-selection-background": "#89b4fa 35%",  # Blue with transparency
+        # Additional Catppuccin-specific variables
+        "border-color": "#6c7086",  # Overlay1 for borders
+        "scrollbar-color": "#585b70",  # Overlay0 for scrollbars
+        "scrollbar-hover-color": "#6c7086",  # Overlay1 for scrollbar hover
+        "tab-active-foreground": "#cba6f7",  # Mauve for active tabs
+        "tab-inactive-foreground": "#9399b2",  # Subtext0 for inactive tabs
+        "button-hover-background": "#585b70",  # Overlay0 for button hover
+        "text_primary": "#cdd6f4",  # Text - your existing foreground (best contrast)
+        "text_secondary": "#bac2de",  # Subtext1 - slightly dimmed
+        "text_tertiary": "#a6adc8",  # Subtext0 - more subtle
+        "text_muted": "#9399b2",  # Overlay2 - disabled states
+        "text_subtle": "#7f849c",  # Overlay1 - very subtle text
+        "text_faint": "#6c7086",  # Overlay0 - placeholders, hints
+    }
+)
 
-@dataclass
+
+def _default_theme_variables() -> Mapping[str, str]:
+    """Default factory for ThemeConfig.variables, sharing the read-only mapping."""
+    return _DEFAULT_THEME_VARIABLES
+
+
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     """App configuration"""
 
     theme: str = "dark"
     auto_refresh: int = 300  # seconds
     timestamp_format: str = "%m/%d/%y %H:%M"
+    max_parallel_requests: int = 32  # worker threads for GitLab API calls
+    per_page: int = 100  # page size for GitLab list requests
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IconsConfig:
     """Icons configuration"""
 
@@ -25,14 +55,20 @@ class IconsConfig:
     manual: str = "\uf013"  # Cog ()
     skipped: str = "\uf192"  # Circle with dot ()
 
+    # Icon name -> icon, so get is a plain dict lookup rather than getattr
+    _map: dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen, so the derived field has to bypass __setattr__
+        icons = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+        object.__setattr__(self, "_map", icons)
+
     def get(self, key: str, default: Optional[str] = None) -> str:
         """Get icon by key with optional default."""
-        if not default:
-            default = self.default_icon
-        return getattr(self, key, default)
+        return self._map.get(key, default or self.default_icon)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ThemeConfig:
     """Default theme configuration"""
 
@@ -48,23 +84,25 @@ class ThemeConfig:
     surface: str = "#313244"  # Surface0 - elevated surfaces
     panel: str = "#45475a"  # Surface2 - panels and sidebars
     dark: bool = True
-    variables: dict[str, str] = field(
-        default_factory=lambda: {
-            "block-cursor-text-style": "none",
-            "footer-key-foreground": "#cba6f7",  # Mauve for footer keys
-            "input-selection-background": "#89b4fa 35%",  # Blue with transparency
-            # Additional Catppuccin-specific variables
-            "border-color": "#6c7086",  # Overlay1 for borders
-            "scrollbar-color": "#585b70",  # Overlay0 for scrollbars
-            "scrollbar-hover-color": "#6c7086",  # Overlay1 for scrollbar hover
-            "tab-active-foreground": "#cba6f7",  # Mauve for active tabs
-            "tab-inactive-foreground": "#9399b2",  # Subtext0 for inactive tabs
-            "button-hover-background": "#585b70",  # Overlay0 for button hover
-            "text_primary": "#cdd6f4",  # Text - your existing foreground (best contrast)
-            "text_secondary": "#bac2de",  # Subtext1 - slightly dimmed
-            "text_tertiary": "#a6adc8",  # Subtext0 - more subtle
-            "text_muted": "#9399b2",  # Overlay2 - disabled states
-            "text_subtle": "#7f849c",  # Overlay1 - very subtle text
-            "text_faint": "#6c7086",  # Overlay0 - placeholders, hints
-        }
-    )
+    # Only ever read, so every default ThemeConfig shares the read-only mapping
+    variables: Mapping[str, str] = field(default_factory=_default_theme_variables)
+    # Resolved from variables once, as widgets read it on construction
+    text_secondary: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        text_secondary = self.variables.get(
+            "text_secondary", _DEFAULT_THEME_VARIABLES["text_secondary"]
+        )
+        object.__setattr__(self, "text_secondary", text_secondary)
+
+    def to_theme_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for building a textual Theme from this config."""
+        kwargs = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+        kwargs["variables"] = dict(self.variables)
+        return kwargs
+
+
+# Shared defaults, used as-is when a config section is missing
+DEFAULT_APP_CONFIG = AppConfig()
+DEFAULT_ICONS_CONFIG = IconsConfig()
+DEFAULT_THEME_CONFIG = ThemeConfig()
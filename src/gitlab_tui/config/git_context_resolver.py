@@ -1,4 +1,6 @@
+import os
 import subprocess  # nosec B404
+from functools import cached_property, lru_cache
 from logging import Logger
 from pathlib import Path
 from typing import Optional
@@ -6,19 +8,179 @@ from typing import Optional
 from gitlab_tui.utils.exceptions import ConfigError
 
 
+@lru_cache(maxsize=32)
+def _parse_remote_url(url: str) -> tuple[str, str]:
+    """Split a remote URL into its domain and GitLab project path in one pass.
+
+    Supports:
+    - https://gitlab.com/group/project.git
+    - git@gitlab.com:group/project.git
+    - https://gitlab.example.com/group/subgroup/project.git
+
+    Returns:
+        Tuple of (domain, project path)
+
+    Raises:
+        ConfigError: On unexpected URL format
+    """
+    # Ignore trailing slashes and the .git suffix
+    url = url.rstrip("/").removesuffix(".git")
+
+    # Split once on the separator for the format, without any regex
+    if "://" in url:
+        # HTTPS format: https://gitlab.com/group/project
+        _, _, rest = url.partition("://")
+        domain, _, path = rest.partition("/")
+        # Drop any credentials, e.g. ssh://git@gitlab.com/group/project
+        domain = domain.rpartition("@")[2]
+    elif url.startswith("git@"):
+        # SSH format: git@gitlab.com:group/project
+        domain, _, path = url.removeprefix("git@").partition(":")
+    else:
+        raise ConfigError("Unexpected url format")
+
+    # Plain string checks reject empty path segments, e.g. group//project
+    if (
+        not domain
+        or not path
+        or path.startswith("/")
+        or path.endswith("/")
+        or "//" in path
+    ):
+        raise ConfigError("Unexpected url format")
+    return domain, path
+
+
+def _config_value(raw: str) -> Optional[str]:
+    """Unquote a git config value and drop any trailing comment.
+
+    Returns:
+        The value, or None if it uses escapes or unbalanced quotes that only
+        git itself should interpret
+    """
+    if "\\" in raw:
+        return None
+
+    chars = []
+    in_quotes = False
+    for char in raw:
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char in "#;" and not in_quotes:
+            break
+        else:
+            chars.append(char)
+    if in_quotes:
+        return None
+    return "".join(chars).strip()
+
+
 class GitContextResolver:
     """Manages reading the projects .git configuration"""
 
     def __init__(self, logger: Logger):
         self.logger = logger
-        self._remote_url: Optional[str] = None
-        self._project_path: Optional[str] = None
-        self._domain: Optional[str] = None
-        self._current_branch: Optional[str] = None
+
+    @cached_property
+    def _git_dirs(self) -> Optional[tuple[Path, Path]]:
+        """Locate the git directory for the current working directory.
+
+        Handles both regular checkouts and worktrees, where `.git` is a file
+        pointing at the real git directory.
+
+        Returns:
+            Tuple of (git dir holding HEAD, common dir holding config), or None
+            if it can't be determined without invoking git
+        """
+        if "GIT_DIR" in os.environ:
+            return None
+
+        cwd = Path.cwd()
+        for directory in (cwd, *cwd.parents):
+            dot_git = directory / ".git"
+            if dot_git.is_dir():
+                return dot_git, dot_git
+            if dot_git.is_file():
+                try:
+                    content = dot_git.read_text().strip()
+                except OSError:
+                    return None
+                if not content.startswith("gitdir:"):
+                    return None
+                git_dir = directory / content.removeprefix("gitdir:").strip()
+                commondir_file = git_dir / "commondir"
+                try:
+                    common_dir = git_dir / commondir_file.read_text().strip()
+                except OSError:
+                    common_dir = git_dir
+                return git_dir, common_dir
+        return None
+
+    def _read_remote_url(self) -> Optional[str]:
+        """Read the origin remote URL straight from the repository's config file.
+
+        Returns:
+            Remote URL string, or None if it couldn't be read
+        """
+        if self._git_dirs is None:
+            return None
+        try:
+            content = (self._git_dirs[1] / "config").read_text()
+        except OSError:
+            return None
+
+        url = None
+        in_origin = False
+        for line in content.splitlines():
+            line = line.strip()
+            if not line or line[0] in "#;":
+                continue
+            if line.startswith("["):
+                section, _, rest = line[1:].partition("]")
+                if rest.strip() and rest.strip()[0] not in "#;":
+                    return None  # Entries after the header, leave it to git
+                # Section names are case-insensitive, subsection names aren't
+                name, _, subsection = section.partition(" ")
+                in_origin = (
+                    name.lower() == "remote" and subsection.strip() == '"origin"'
+                ) or section.lower() == "remote.origin"
+            elif in_origin:
+                key, _, value = line.partition("=")
+                if key.strip().lower() == "url":
+                    # Like `git config --get`, the last value wins
+                    url = _config_value(value)
+                    if url is None:
+                        return None
+        return url or None
+
+    def _read_current_branch(self) -> Optional[str]:
+        """Read the current branch straight from the repository's HEAD file.
+
+        Returns:
+            Branch name, "HEAD" when detached, or None if it couldn't be read
+        """
+        if self._git_dirs is None:
+            return None
+        try:
+            head = (self._git_dirs[0] / "HEAD").read_text().strip()
+        except OSError:
+            return None
+
+        if head.startswith("ref: refs/heads/"):
+            branch = head.removeprefix("ref: refs/heads/")
+            # Reftable repositories keep a stub HEAD pointing at this
+            # placeholder, the real ref lives where only git can read it
+            return None if branch == ".invalid" else branch
+        if not head.startswith("ref:"):
+            return "HEAD"  # Detached, matches `git rev-parse --abbrev-ref HEAD`
+        return None
 
     def _init_remote_url(self) -> str:
         """Get the Git remote URL for the current repository.
 
+        Reads the repository config directly, only falling back to running
+        git when that isn't possible.
+
         Returns:
             Remote URL string
 
@@ -28,15 +190,17 @@ class GitContextResolver:
                 - No remote origin configured
                 - Git command not found
         """
+        remote_url = self._read_remote_url()
+        if remote_url is not None:
+            return remote_url
+
         try:
             result = subprocess.run(
                 ["git", "config", "--get", "remote.origin.url"],  # nosec B603 B607
                 capture_output=True,
-                text=True,
                 check=True,
-                cwd=Path.cwd(),
             )
-            return result.stdout.strip()
+            return result.stdout.strip().decode()
         except subprocess.CalledProcessError as e:
             self.logger.debug("Not in a git repository or no remote configured")
             raise ConfigError("Not in a git repo or no remote configured") from e
@@ -44,111 +208,51 @@ class GitContextResolver:
             self.logger.warning("Git command not found")
             raise ConfigError("Git command not found") from e
 
-    def _get_project_path_from_url(self, url: str) -> str:
-        """Extract GitLab project path from a remote URL.
-
-        Supports:
-        - https://gitlab.com/group/project.git
-        - git@gitlab.com:group/project.git
-        - https://gitlab.example.com/group/subgroup/project.git
-
-        Returns:
-            Project path string
-
-        Raises:
-            ConfigError: On unexpected URL format
-
-        """
-        # Remove .git suffix
-        url = url.rstrip("/")
-        if url.endswith(".git"):
-            url = url[:-4]
-
-        # Handle SSH format: git@gitlab.com:group/project
-        if url.startswith("git@"):
-            parts = url.split(":")
-            if len(parts) >= 2:
-                return parts[1]
-
-        # Handle HTTPS format: https://gitlab.com/group/project
-        if "://" in url:
-            parts = url.split("://", 1)[1].split("/", 1)
-            if len(parts) >= 2:
-                return parts[1]
-
-        raise ConfigError("Unexpected url format")
-
-    def _get_domain_from_url(self, url: str) -> str:
-        """Extract GitLab domain from a remote URL.
-
-        Supports:
-        - https://gitlab.com/group/project.git
-        - git@gitlab.com:group/project.git
-        - https://gitlab.example.com/group/subgroup/project.git
-
-        Returns:
-            Domain string
-
-        Raises:
-            ConfigError: On unexpected URL format
-        """
-        # Handle SSH format: git@gitlab.com:group/project
-        if url.startswith("git@"):
-            url = url[4:]
-            parts = url.split(":")
-            if len(parts) >= 2:
-                return parts[0]
-
-        # Handle HTTPS format: https://gitlab.com/group/project
-        if "://" in url:
-            # Split by protocol and take the part after the domain
-            parts = url.split("://", 1)[1].split("/", 1)
-            if len(parts) >= 2:
-                return parts[0]
-
-        raise ConfigError("Unexpected url format")
-
     def _init_current_branch(self) -> str:
         """Get the current Git branch name
 
+        Reads HEAD directly, only falling back to running git when that
+        isn't possible.
+
         Returns:
             Branch name string
         """
+        current_branch = self._read_current_branch()
+        if current_branch is not None:
+            return current_branch
+
         try:
             result = subprocess.run(
                 ["git", "rev-parse", "--abbrev-ref", "HEAD"],  # nosec B603 B607
                 capture_output=True,
-                text=True,
                 check=True,
-                cwd=Path.cwd(),
             )
-            return result.stdout.strip()
+            return result.stdout.strip().decode()
         except subprocess.CalledProcessError as e:
             self.logger.info("Could not determine current branch")
             raise ConfigError("Could not determine current branch") from e
 
-    def get_remote_url(self) -> str:
-        """Get the remote url for the selected project."""
-        if self._remote_url is None:
-            self._remote_url = self._init_remote_url()
-        return self._remote_url
-
-    def get_domain(self) -> str:
-        """Get the domain for the selected project"""
-        if self._domain is None:
-            remote_url = self.get_remote_url()
-            self._domain = self._get_domain_from_url(remote_url)
-        return self._domain
-
-    def get_project_path(self) -> str:
-        """Get the project path for the selected project"""
-        if self._project_path is None:
-            remote_url = self.get_remote_url()
-            self._project_path = self._get_project_path_from_url(remote_url)
-        return self._project_path
-
-    def get_current_branch(self) -> str:
-        """Get the current branch for the selected project"""
-        if self._current_branch is None:
-            self._current_branch = self._init_current_branch()
-        return self._current_branch
+    @cached_property
+    def remote_url(self) -> str:
+        """The remote url for the selected project."""
+        return self._init_remote_url()
+
+    @cached_property
+    def _remote_parts(self) -> tuple[str, str]:
+        """The remote url split into domain and project path, parsed once."""
+        return _parse_remote_url(self.remote_url)
+
+    @cached_property
+    def domain(self) -> str:
+        """The domain for the selected project"""
+        return self._remote_parts[0]
+
+    @cached_property
+    def project_path(self) -> str:
+        """The project path for the selected project"""
+        return self._remote_parts[1]
+
+    @cached_property
+    def current_branch(self) -> str:
+        """The current branch for the selected project"""
+        return self._init_current_branch()
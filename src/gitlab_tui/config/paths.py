@@ -0,0 +1,18 @@
+"""Filesystem locations for GitLab TUI configuration, resolved once at import."""
+
+import os
+from pathlib import Path
+
+
+def _config_home() -> Path:
+    """Honour XDG_CONFIG_HOME, falling back to ~/.config.
+
+    The XDG spec says relative paths are invalid and must be ignored.
+    """
+    xdg_config_home = os.environ.get("XDG_CONFIG_HOME")
+    if xdg_config_home and os.path.isabs(xdg_config_home):
+        return Path(xdg_config_home)
+    return Path.home() / ".config"
+
+
+CONFIG_DIR = _config_home() / "gitlab-tui"
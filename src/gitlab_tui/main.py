@@ -1,16 +1,19 @@
 #!/usr/bin/env python3
 """GitLab TUI - A terminal interface for GitLab pipelines and more."""
-import os
+
 import sys
 
 from gitlab_tui.api.client import GitlabAPI
 from gitlab_tui.api.mock.mock_client import MockGitlabAPI
 from gitlab_tui.app import GitLabTUI
 from gitlab_tui.config.config import Config
+from gitlab_tui.utils.env import env_flag
 from gitlab_tui.utils.exceptions import ConfigError
-from gitlab_tui.utils.logger import get_logger
+from gitlab_tui.utils.logger import LOG_FILE, get_logger
 from gitlab_tui.utils.parse_args import parse_args
 
+_MOCK_MODE = env_flag("MOCK_MODE")
+
 
 def main() -> None:
     """Main entry point for the GitLab TUI application."""
@@ -22,17 +25,17 @@ def main() -> None:
         config = Config(logger=logger)
 
         # Get GitLab configuration
-        gitlab_domain = config.git.get_domain()
-        gitlab_project = args.project or config.git.get_project_path()
-        gitlab_branch = args.branch or config.git.get_current_branch()
-        gitlab_token = config.credentials.get_token()
+        git = config.git
+        gitlab_domain = git.domain
+        gitlab_project = args.project or git.project_path
+        gitlab_branch = args.branch or git.current_branch
+        gitlab_token = config.credentials.token
 
         # Build GitLab URL from domain
         gitlab_url = f"https://{gitlab_domain}"
 
         gitlab_api: GitlabAPI
-        mock_mode = os.getenv("MOCK_MODE", "").lower() in ("true", "1", "yes")
-        if mock_mode:
+        if _MOCK_MODE:
             gitlab_api = MockGitlabAPI()
         else:
             gitlab_api = GitlabAPI(
@@ -60,7 +63,8 @@ def main() -> None:
         logger.error(f"Unexpected error: {e}", exc_info=True)
         # Show generic error message to user
         print(
-            f"Unexpected error occurred. Check logs for details: {e}", file=sys.stderr
+            f"Unexpected error occurred. Check logs for details ({LOG_FILE}): {e}",
+            file=sys.stderr,
         )
         sys.exit(1)
 
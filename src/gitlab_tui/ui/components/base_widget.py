@@ -1,5 +1,6 @@
 """Base Widget component for common dependecies and methods"""
 
+from functools import lru_cache
 from logging import Logger
 
 from rich.style import Style
@@ -8,11 +9,35 @@ from rich.text import Text
 from gitlab_tui.config.config import Config
 
 
+@lru_cache(maxsize=32)
+def _style_for(colour: str) -> Style:
+    """Styles come from a small fixed palette, so build each one only once"""
+    return Style(color=colour)
+
+
+@lru_cache(maxsize=4)
+def _status_table_for(config: Config) -> dict[str, tuple[str, str]]:
+    """Resolve the icon and colour for every known status, once per config"""
+    theme = config.theme
+    icons = config.icons
+    status_colours = {
+        "success": theme.success,
+        "failed": theme.error,
+        "running": theme.secondary,
+        "pending": theme.secondary,
+        "canceled": theme.text_secondary,
+        "created": theme.accent,
+        "manual": theme.primary,
+        "skipped": theme.text_secondary,
+    }
+    return {
+        status: (icons.get(status), colour) for status, colour in status_colours.items()
+    }
+
+
 class BaseComponent:
     """Base widget for common dependencies and methods"""
 
-    DEFAULT_COLOUR: str = "#cdd6f4"
-
     def __init__(
         self,
         logger: Logger,
@@ -22,26 +47,12 @@ class BaseComponent:
         super().__init__(**kwargs)
         self.logger = logger
         self.config = config
-        self.DEFAULT_COLOUR = self.config.theme.variables["text_secondary"]
+        self.DEFAULT_COLOUR = self.config.theme.text_secondary
+        self._status_table = _status_table_for(config)
+        self._default_status = (self.config.icons.default_icon, self.DEFAULT_COLOUR)
 
     def _get_status_icon_and_colour(self, status: str) -> tuple[str, str]:
-        status_colours = {
-            "success": self.config.theme.success,
-            "failed": self.config.theme.error,
-            "running": self.config.theme.secondary,
-            "pending": self.config.theme.secondary,
-            "canceled": self.config.theme.variables["text_secondary"],
-            "created": self.config.theme.accent,
-            "manual": self.config.theme.primary,
-            "skipped": self.config.theme.variables["text_secondary"],
-        }
-
-        status_icon = self.config.icons.get(status)
-        status_colour = status_colours.get(status, self.DEFAULT_COLOUR)
-
-        return status_icon, status_colour
+        return self._status_table.get(status, self._default_status)
 
     def _format_text(self, text: str, colour: str) -> Text:
-        formatted_text = Text(text)
-        formatted_text.stylize(Style(color=colour))
-        return formatted_text
+        return Text(text, style=_style_for(colour))
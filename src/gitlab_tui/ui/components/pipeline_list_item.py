@@ -1,6 +1,7 @@
 """Pipeline sidebar component for displaying pipeline history."""
 
 from datetime import datetime
+from functools import lru_cache
 from logging import Logger
 from typing import Any, Dict
 
@@ -11,49 +12,64 @@ from gitlab_tui.config.config import Config
 from gitlab_tui.ui.components.base_widget import BaseComponent
 
 
+@lru_cache(maxsize=1024)
+def _format_created(created_at: str, timestamp_format: str) -> str:
+    """Format a pipeline's created_at once, as refreshes repeat the same values"""
+    if created_at.endswith("Z"):
+        created_at = created_at.removesuffix("Z") + "+00:00"
+    try:
+        return datetime.fromisoformat(created_at).strftime(timestamp_format)
+    except ValueError:
+        return "Unknown"
+
+
 class PipelineListItem(BaseComponent, ListItem):
     """A custom list item for displaying pipeline information."""
 
+    # Widget instances keep a __dict__, but our own attributes at least get slots
+    __slots__ = ("pipeline_data", "pipeline_id", "status_text")
+
     def __init__(
         self, logger: Logger, config: Config, pipeline_data: Dict[str, Any], **kwargs
     ) -> None:
         BaseComponent.__init__(self, logger, config, **kwargs)
         self.pipeline_data = pipeline_data
+        self.pipeline_id = pipeline_data.get("id")
         self.can_focus = True
 
+        # Resolved once while the sidebar builds its items, not on every compose
+        status = pipeline_data.get("status", "unknown")
+        ref = pipeline_data.get("ref", "unknown")
+        status_icon, status_colour = self._get_status_icon_and_colour(status)
+        self.status_text = self._format_text(
+            text=f"{status_icon} {ref}", colour=status_colour
+        )
+
     def compose(self):
         """Compose the pipeline list item."""
         pipeline = self.pipeline_data
 
         # Extract pipeline info
-        status = pipeline.get("status", "unknown")
-        ref = pipeline.get("ref", "unknown")
         created_at = pipeline.get("created_at", "")
 
         # Format created time
-        try:
-            created_time = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-            time_str = created_time.strftime(self.config.app.timestamp_format)
-        except (ValueError, AttributeError):
+        if isinstance(created_at, str):
+            time_str = _format_created(created_at, self.config.app.timestamp_format)
+        else:
             time_str = "Unknown"
 
         # Get author info
         user = pipeline.get("user", {})
         author = user.get("name", user.get("username", "Unknown"))
 
-        status_icon, status_colour = self._get_status_icon_and_colour(status)
-        status_text = self._format_text(
-            text=f"{status_icon} {ref}", colour=status_colour
-        )
-
         with Vertical():
             # Single line with status and ref
             with Horizontal():
-                yield Label(status_text, classes="pipeline-id")
+                yield Label(self.status_text, classes="pipeline-id")
             # Single line with author and time
             with Horizontal():
                 yield Label(
-                    f"{author[:12]}.." if len(author) > 12 else author,
+                    author if len(author) <= 12 else author[:12] + "..",
                     classes="pipeline-author",
                 )
                 yield Label(time_str, classes="pipeline-time")
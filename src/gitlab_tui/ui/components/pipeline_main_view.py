@@ -1,9 +1,10 @@
 """Pipeline main view component for displaying pipeline jobs and stages."""
 
-from itertools import groupby
+from functools import lru_cache
+from itertools import zip_longest
 from logging import Logger
 from operator import itemgetter
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from rich.text import Text
 from textual.containers import Center, Grid, Vertical
@@ -14,6 +15,10 @@ from textual.widgets import DataTable, Label, Static
 from gitlab_tui.config.config import Config
 from gitlab_tui.ui.components.base_widget import BaseComponent
 
+# GitLab always sends both keys, so fetch them together and only fall back to
+# defaults when a job is missing one
+_job_name_and_status = itemgetter("name", "status")
+
 
 class PipelineMainView(BaseComponent, Widget):
     """Main view for displaying pipeline details and jobs."""
@@ -27,33 +32,69 @@ class PipelineMainView(BaseComponent, Widget):
         **kwargs,
     ):
         super().__init__(logger, config, **kwargs)
+        # What the view was last built from, to skip rebuilding unchanged data
+        self._jobs_fingerprint: Optional[tuple] = None
+        self._current_columns: tuple[str, ...] = ()
+        # Job names repeat across pipelines and refreshes, so reuse their cells
+        self._job_cell_text = lru_cache(maxsize=1024)(self._build_job_cell_text)
 
     def compose(self):
         """Compose the main view widget."""
+        # Keep references to the widgets updated on every refresh, so updates
+        # don't need to query the DOM for them
+        self._info_grid = Grid(id="info-grid", classes="info-grid hidden")
+        self._id_value = Label("", classes="info-value")
+        self._status_value = Label("", classes="info-value")
+        self._jobs_value = Label("", classes="info-value")
+        self._job_table: DataTable = DataTable(
+            id="job-table", zebra_stripes=True, classes="job-table"
+        )
+        self._placeholder = Static(
+            "Select a pipeline to view details",
+            id="placeholder",
+            classes="placeholder",
+        )
         with Vertical():
             # Compact pipeline info section
             with Vertical(id="info-section", classes="info-section"):
                 yield Label("Pipeline Details", classes="title")
-                with Grid(id="info-grid", classes="info-grid"):
-                    # Empty initially, will be filled when jobs are loaded
-                    pass
+                with self._info_grid:
+                    # Hidden initially, values are filled when jobs are loaded
+                    yield Label("ID:", classes="info-label")
+                    yield self._id_value
+                    yield Label("Status:", classes="info-label")
+                    yield self._status_value
+                    yield Label("Jobs:", classes="info-label")
+                    yield self._jobs_value
 
             # Job table takes up remaining space
             with Vertical(id="jobs-section", classes="jobs-section"):
                 yield Label("Pipeline Stages and Jobs", classes="title")
-                yield DataTable(id="job-table", zebra_stripes=True, classes="job-table")
+                yield self._job_table
 
             with Center():
-                yield Static(
-                    "Select a pipeline to view details",
-                    id="placeholder",
-                    classes="placeholder",
-                )
+                yield self._placeholder
 
     async def update_pipeline_jobs(self, jobs: List[Dict[str, Any]]) -> None:
         """Update the view with job data."""
         self.jobs = jobs
 
+        # Job ids can repeat across pipelines, so the pipeline and each job's
+        # name and stage are part of what makes the view unchanged
+        pipeline = jobs[0].get("pipeline", {}) if jobs else {}
+        fingerprint = (
+            pipeline.get("id"),
+            pipeline.get("status"),
+            tuple(
+                (j.get("id"), j.get("name"), j.get("stage"), j.get("status"))
+                for j in jobs
+            ),
+        )
+        if fingerprint == self._jobs_fingerprint:
+            self.logger.debug("Jobs unchanged, keeping current view")
+            return
+        self._jobs_fingerprint = fingerprint
+
         if not jobs:
             self._show_placeholder(True)
             return
@@ -61,16 +102,13 @@ class PipelineMainView(BaseComponent, Widget):
         self._show_placeholder(False)
 
         # Update info grid
-        await self._update_info_grid(jobs)
+        self._update_info_grid(jobs)
 
         # Update job table
         await self._update_job_table(jobs)
 
-    async def _update_info_grid(self, jobs: List[Dict[str, Any]]) -> None:
+    def _update_info_grid(self, jobs: List[Dict[str, Any]]) -> None:
         """Update the pipeline info grid."""
-        info_grid = self.query_one("#info-grid", Grid)
-        info_grid.remove_children()
-
         # Get the first job to extract pipeline info
         if not jobs:
             return
@@ -84,49 +122,38 @@ class PipelineMainView(BaseComponent, Widget):
         pipeline_id = pipeline.get("id", "Unknown")
         pipeline_status = pipeline.get("status", "Unknown").title()
 
-        # Add info rows
-        await info_grid.mount(Label("ID:", classes="info-label"))
-        await info_grid.mount(Label(f"#{pipeline_id}", classes="info-value"))
-
-        await info_grid.mount(Label("Status:", classes="info-label"))
-        await info_grid.mount(Label(pipeline_status, classes="info-value"))
-
-        await info_grid.mount(Label("Jobs:", classes="info-label"))
-        await info_grid.mount(
-            Label(
-                f"{total_jobs} total jobs",
-                classes="info-value",
-            )
-        )
+        # Update the existing value labels in place
+        self._id_value.update(f"#{pipeline_id}")
+        self._status_value.update(pipeline_status)
+        self._jobs_value.update(f"{total_jobs} total jobs")
+        self._info_grid.remove_class("hidden")
 
     async def _update_job_table(self, jobs: List[Dict[str, Any]]) -> None:
         """Update the job table with stage columns and job rows."""
-        table = self.query_one("#job-table", DataTable)
-        table.clear(columns=True)
+        table = self._job_table
 
         # Group jobs by stage
-        jobs_by_stage = self._group_jobs_by_stage(jobs)
-        if not jobs_by_stage:
+        stages, stage_job_lists = self._group_jobs_by_stage(jobs)
+
+        # Pipelines of a project usually share stages, so only rebuild the
+        # columns when they change
+        if stages != self._current_columns:
+            table.clear(columns=True)
+            table.add_columns(*stages)
+            self._current_columns = stages
+        else:
+            table.clear()
+
+        if not stages:
             return
 
-        # Add columns for each stage
-        stages = list(jobs_by_stage.keys())
-        table.add_columns(*stages)
-
-        # Find the max number of jobs in any stage
-        max_jobs = max(len(jobs_by_stage[stage]) for stage in stages)
-
-        # Prepare row data
-        rows: List[List[Text]] = []
-        for i in range(max_jobs):
-            row: List[Text] = []
-            for stage in stages:
-                stage_jobs = jobs_by_stage[stage]
-                if i < len(stage_jobs):
-                    job = stage_jobs[i]
-                    job_info = self._format_job_cell(job)
-                    row.append(job_info)
-            rows.append(row)
+        # Transpose the stage columns into rows, padding shorter stages
+        format_job_cell = self._format_job_cell
+        empty = Text("")
+        rows: List[List[Text]] = [
+            [empty if job is None else format_job_cell(job) for job in row]
+            for row in zip_longest(*stage_job_lists)
+        ]
 
         # Add rows
         if rows:
@@ -134,36 +161,44 @@ class PipelineMainView(BaseComponent, Widget):
 
     def _group_jobs_by_stage(
         self, jobs: List[Dict[str, Any]]
-    ) -> Dict[str, List[Dict[str, Any]]]:
-        """Group jobs by stage and sort by stage and job name."""
-        # First sort by stage_idx to preserve stage order
-        sorted_jobs = sorted(
-            jobs, key=lambda j: (j.get("stage_idx", 999), j.get("stage", ""))
-        )
-
-        # Group by stage
-        result = {}
-        for stage, jobs_in_stage in groupby(sorted_jobs, key=itemgetter("stage")):
-            result[stage] = list(jobs_in_stage)
-
-        return result
+    ) -> Tuple[Tuple[str, ...], List[List[Dict[str, Any]]]]:
+        """Group jobs by stage, ordered by stage index.
+
+        Returns:
+            Tuple of (stage names, the jobs of each stage in the same order)
+        """
+        # Bucket jobs by stage in a single pass, then order only the stages
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        stage_order: Dict[str, int] = {}
+        for job in jobs:
+            stage = job.get("stage", "")
+            stage_jobs = result.get(stage)
+            if stage_jobs is None:
+                stage_jobs = result[stage] = []
+                stage_order[stage] = job.get("stage_idx", 999)
+            stage_jobs.append(job)
+
+        stages = tuple(sorted(result, key=lambda s: (stage_order[s], s)))
+        return stages, [result[stage] for stage in stages]
 
     def _format_job_cell(self, job: Dict[str, Any]) -> Text:
         """Format a job cell with name and status."""
-        job_name = job.get("name", "Unknown")
-        job_status = job.get("status", "unknown")
+        try:
+            job_name, job_status = _job_name_and_status(job)
+        except KeyError:
+            job_name = job.get("name", "Unknown")
+            job_status = job.get("status", "unknown")
 
-        status_icon, status_colour = self._get_status_icon_and_colour(job_status)
-
-        formatted_text = self._format_text(
-            text=f"{status_icon} {job_name}", colour=status_colour
-        )
+        return self._job_cell_text(job_status, job_name)
 
-        return formatted_text
+    def _build_job_cell_text(self, job_status: str, job_name: str) -> Text:
+        """Build the styled text for a job cell."""
+        status_icon, status_colour = self._get_status_icon_and_colour(job_status)
+        return self._format_text(text=f"{status_icon} {job_name}", colour=status_colour)
 
     def _show_placeholder(self, show: bool) -> None:
         """Show or hide the placeholder message."""
-        placeholder = self.query_one("#placeholder", Static)
+        placeholder = self._placeholder
         if show:
             placeholder.add_class("placeholder")
             placeholder.remove_class("hidden")
@@ -1,6 +1,6 @@
 """Pipeline sidebar component for displaying pipeline history."""
 
-from logging import Logger
+from logging import DEBUG, Logger
 from typing import Any, Dict, List, Optional
 
 from textual.containers import Vertical
@@ -21,50 +21,72 @@ class PipelineSidebar(BaseComponent, Widget):
     selected_pipeline_id: reactive[Optional[int]] = reactive(None)
 
     def __init__(self, logger: Logger, config: Config, **kwargs) -> None:
-        BaseComponent.__init__(self, logger, config, **kwargs)
-        Widget.__init__(self, **kwargs)
+        super().__init__(logger, config, **kwargs)
+        # What the list was last built from, to skip rebuilding unchanged data
+        self._pipelines_fingerprint: Optional[tuple] = None
 
     def compose(self):
         """Compose the sidebar widget."""
+        # Keep references to the widgets updated on every refresh, so updates
+        # don't need to query the DOM for them
+        self._loading = Static("Loading pipelines...", id="loading", classes="loading")
+        self._list_view = ListView(id="pipeline-list")
+        self._empty_message = Static(
+            "No pipelines found", id="empty-message", classes="hidden"
+        )
         with Vertical():
             yield Label("Pipeline History", classes="title")
-            yield Static("Loading pipelines...", id="loading", classes="loading")
-            yield ListView(id="pipeline-list")
-            yield Static("No pipelines found", id="empty-message", classes="hidden")
+            yield self._loading
+            yield self._list_view
+            yield self._empty_message
 
     async def update_pipelines(self, pipelines: List[Dict[str, Any]]) -> None:
         """Update the pipeline list with new data."""
         self.logger.info(f"Updating sidebar with {len(pipelines)} pipelines")
         self.pipelines = pipelines
 
+        fingerprint = tuple(
+            (p.get("id"), p.get("status"), p.get("updated_at")) for p in pipelines
+        )
+        if fingerprint == self._pipelines_fingerprint:
+            self.logger.debug("Pipelines unchanged, keeping current list")
+            return
+        self._pipelines_fingerprint = fingerprint
+
         # Hide loading message
         self.logger.debug("Hiding loading message")
-        loading = self.query_one("#loading", Static)
-        loading.add_class("hidden")
+        self._loading.add_class("hidden")
 
         # Get the ListView and update it
         self.logger.debug("Clearing pipeline list view")
-        list_view = self.query_one("#pipeline-list", ListView)
+        list_view = self._list_view
         list_view.clear()
 
         if not pipelines:
             # Show empty message
             self.logger.warning("No pipelines to display, showing empty message")
-            empty_msg = self.query_one("#empty-message", Static)
-            empty_msg.remove_class("hidden")
+            self._empty_message.remove_class("hidden")
             return
 
         # Hide empty message and add pipeline items
         self.logger.debug("Hiding empty message and adding pipeline items")
-        empty_msg = self.query_one("#empty-message", Static)
-        empty_msg.add_class("hidden")
+        self._empty_message.add_class("hidden")
+
+        if self.logger.isEnabledFor(DEBUG):
+            for i, pipeline in enumerate(pipelines):
+                self.logger.debug(
+                    "Adding pipeline item %d: ID=%s, status=%s",
+                    i + 1,
+                    pipeline.get("id"),
+                    pipeline.get("status"),
+                )
 
-        for i, pipeline in enumerate(pipelines):
-            self.logger.debug(
-                f"Adding pipeline item {i+1}: ID={pipeline.get('id')}, status={pipeline.get('status')}"
-            )
-            item = PipelineListItem(self.logger, self.config, pipeline)
-            await list_view.append(item)
+        # Mount every item at once so the list is laid out in a single pass
+        items = [
+            PipelineListItem(self.logger, self.config, pipeline)
+            for pipeline in pipelines
+        ]
+        await list_view.extend(items)
 
         self.logger.debug(
             f"Successfully added {len(pipelines)} pipeline items to sidebar"
@@ -72,27 +94,22 @@ class PipelineSidebar(BaseComponent, Widget):
 
     def on_list_view_selected(self, message: ListView.Selected) -> None:
         """Handle pipeline selection from the list."""
-        self.logger.debug(f"List view selection event triggered: {message}")
-        if message.item and hasattr(message.item, "pipeline_data"):
-            pipeline_id = message.item.pipeline_data.get("id")
-            pipeline_status = message.item.pipeline_data.get("status")
-            self.logger.info(
-                f"Pipeline selected: ID={pipeline_id}, status={pipeline_status}"
-            )
-            if pipeline_id:
-                self.selected_pipeline_id = pipeline_id
-                # Post a message to the parent app
-                self.logger.debug(
-                    f"Posting PipelineSelected message for pipeline {pipeline_id}"
-                )
-                self.post_message(PipelineSelected(pipeline_id))
-        else:
+        pipeline_id = getattr(message.item, "pipeline_id", None)
+        if pipeline_id is None:
             self.logger.warning("Invalid list view selection - no pipeline data found")
+            return
+
+        self.logger.info("Pipeline selected: ID=%s", pipeline_id)
+        self.selected_pipeline_id = pipeline_id
+        # Post a message to the parent app
+        self.post_message(PipelineSelected(pipeline_id))
 
 
 class PipelineSelected(Message):
     """Message sent when a pipeline is selected."""
 
+    __slots__ = ("pipeline_id",)
+
     def __init__(self, pipeline_id: int) -> None:
         self.pipeline_id = pipeline_id
         super().__init__()
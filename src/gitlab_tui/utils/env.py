@@ -0,0 +1,16 @@
+import os
+
+# Values that switch an environment flag on, compared case-insensitively
+_TRUTHY = frozenset({"true", "1", "yes"})
+
+
+def env_flag(name: str) -> bool:
+    """Whether the environment variable is set to a truthy value.
+
+    Args:
+        name: Name of the environment variable
+
+    Returns:
+        True if the variable is "true", "1" or "yes", ignoring case and whitespace
+    """
+    return os.getenv(name, "").strip().lower() in _TRUTHY
@@ -1,23 +1,68 @@
-import os
-from logging import DEBUG, INFO, FileHandler, Formatter, Logger, getLogger
-from pathlib import Path
+import atexit
+from logging import (
+    DEBUG,
+    INFO,
+    WARNING,
+    FileHandler,
+    Formatter,
+    Logger,
+    getLogger,
+)
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Optional
 
+from gitlab_tui.config.paths import CONFIG_DIR
+from gitlab_tui.utils.env import env_flag
+
+LOG_FILE = CONFIG_DIR / "logs" / "gitlab-tui.log"
+
+# Writes the queued debug records to the log file off the UI thread
+_listener: Optional[QueueListener] = None
 
-def get_logger() -> Logger:
-    """Setup logging for debug mode."""
-    log_dir = Path.home() / ".config" / "gitlab-tui" / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
 
-    log_file = log_dir / "gitlab-tui.log"
+def _stop_listener() -> None:
+    """Flush any queued records and stop the log writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger() -> Logger:
+    """Setup logging, writing everything to the log file in debug mode.
 
+    Outside debug mode only warnings and errors reach the log file.
+    """
     logger = getLogger("gitlab_tui")
-    debug_mode_enabled = os.getenv("DEBUG", "").lower() in ["true", "yes", "1"]
+    debug_mode_enabled = env_flag("DEBUG")
     logger.setLevel(DEBUG if debug_mode_enabled else INFO)
     logger.handlers.clear()
+    _stop_listener()
 
-    file_handler = FileHandler(log_file)
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
     file_formatter = Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    if not debug_mode_enabled:
+        # Normal runs only keep warnings and errors, and the file is not
+        # opened until the first one is logged
+        file_handler = FileHandler(LOG_FILE, delay=True)
+        file_handler.setLevel(WARNING)
+        file_handler.setFormatter(file_formatter)
+        logger.addHandler(file_handler)
+        return logger
+
+    file_handler = FileHandler(LOG_FILE)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+
+    # Log calls only enqueue the record, the listener thread does the writing
+    global _listener
+    log_queue: SimpleQueue = SimpleQueue()
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
+
+
+atexit.register(_stop_listener)
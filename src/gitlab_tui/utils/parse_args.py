@@ -1,8 +1,8 @@
 from argparse import ArgumentParser, Namespace, RawDescriptionHelpFormatter
 
 
-def parse_args() -> Namespace:
-    """Parse command line arguments."""
+def _build_parser() -> ArgumentParser:
+    """Build the command line argument parser."""
     parser = ArgumentParser(
         description="GitLab TUI - Terminal interface for GitLab pipelines",
         formatter_class=RawDescriptionHelpFormatter,
@@ -26,4 +26,13 @@ Examples:
         help="Default branch to display (default: main)",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+# Built once at import, the arguments never change between calls
+_PARSER = _build_parser()
+
+
+def parse_args() -> Namespace:
+    """Parse command line arguments."""
+    return _PARSER.parse_args()
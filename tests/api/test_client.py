@@ -0,0 +1,244 @@
+"""Tests for GitlabAPI client."""
+
+from logging import Logger
+from typing import Optional
+from unittest.mock import Mock, patch
+
+import pytest
+
+from gitlab_tui.api import client
+from gitlab_tui.api.client import GitlabAPI, GitLabAPIError
+
+requires_orjson = pytest.mark.skipif(
+    client.orjson is None, reason="orjson is not installed"
+)
+
+
+@pytest.fixture
+def mock_logger():
+    """Create a mock logger"""
+    return Mock(spec=Logger)
+
+
+@pytest.fixture
+def gitlab_api(mock_logger):
+    """Create a GitlabAPI instance"""
+    return GitlabAPI(mock_logger, "https://gitlab.com/", "mock_token")
+
+
+def make_response(
+    content: bytes, status_code: int = 200, headers: Optional[dict] = None
+) -> Mock:
+    """Create a mock response with the given body"""
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+
+class TestDecodeJson:
+    """Test GitlabAPI._decode_json"""
+
+    @requires_orjson
+    def test_decodes_list(self, gitlab_api):
+        response = make_response(b'[{"id": 1}, {"id": 2}]')
+
+        result = gitlab_api._decode_json(response)
+
+        assert result == [{"id": 1}, {"id": 2}]
+        response.json.assert_not_called()
+
+    @requires_orjson
+    def test_decodes_dict(self, gitlab_api):
+        response = make_response(b'{"id": 1, "name": "project"}')
+
+        result = gitlab_api._decode_json(response)
+
+        assert result == {"id": 1, "name": "project"}
+
+    @requires_orjson
+    def test_raises_api_error_on_invalid_json(self, gitlab_api):
+        response = make_response(b"<html>not json</html>")
+
+        with pytest.raises(GitLabAPIError, match="Invalid JSON response"):
+            gitlab_api._decode_json(response)
+
+    @patch("gitlab_tui.api.client.orjson", None)
+    def test_falls_back_to_response_json_without_orjson(self, gitlab_api):
+        response = make_response(b'{"id": 1}')
+        response.json.return_value = {"id": 1}
+
+        result = gitlab_api._decode_json(response)
+
+        assert result == {"id": 1}
+        response.json.assert_called_once()
+
+
+class TestCreateSession:
+    """Test GitlabAPI._create_session"""
+
+    def test_mounts_same_adapter_for_http_and_https(self, gitlab_api):
+        session = gitlab_api._session
+
+        https_adapter = session.get_adapter("https://gitlab.com")
+        http_adapter = session.get_adapter("http://gitlab.com")
+
+        assert https_adapter is http_adapter
+        assert https_adapter._pool_maxsize == GitlabAPI.SESSION_POOL_MAXSIZE
+
+    def test_does_not_retry_post(self, gitlab_api):
+        retries = gitlab_api._session.get_adapter("https://gitlab.com").max_retries
+
+        assert "POST" not in retries.allowed_methods
+        assert 503 in retries.status_forcelist
+        assert retries.respect_retry_after_header is True
+
+    def test_sets_auth_headers(self, gitlab_api):
+        headers = gitlab_api._session.headers
+
+        assert headers["Authorization"] == "Bearer mock_token"
+        assert headers["Accept"] == "application/json"
+        assert headers["Accept-Encoding"] == client.ACCEPT_ENCODING
+
+
+class TestParseProject:
+    """Test GitlabAPI._parse_project"""
+
+    @pytest.mark.parametrize(
+        "input, expected",
+        [
+            (12345, "12345"),
+            ("12345", "12345"),
+            ("group/project", "group%2Fproject"),
+            ("group/subgroup/project", "group%2Fsubgroup%2Fproject"),
+            ("group/prøject", "group%2Fpr%C3%B8ject"),
+        ],
+    )
+    def test_formats_project(self, gitlab_api, input, expected):
+        assert gitlab_api._parse_project(input) == expected
+
+    def test_caches_quoted_project(self, gitlab_api):
+        client._quote_project.cache_clear()
+
+        gitlab_api._parse_project("group/project")
+        gitlab_api._parse_project("group/project")
+
+        assert client._quote_project.cache_info().hits == 1
+
+
+class TestMakeRequest:
+    """Test GitlabAPI._make_request"""
+
+    def test_builds_url_from_api_prefix(self, gitlab_api):
+        response = make_response(b'{"id": 1}')
+        response.json.return_value = {"id": 1}
+        gitlab_api._session = Mock()
+        gitlab_api._session.request.return_value = response
+
+        result = gitlab_api._make_request("GET", "/projects/1")
+
+        assert result == {"id": 1}
+        gitlab_api._session.request.assert_called_once_with(
+            method="GET",
+            url="https://gitlab.com/api/v4/projects/1",
+            timeout=GitlabAPI.REQUEST_TIMEOUT,
+        )
+
+    @pytest.mark.parametrize(
+        "status_code, expect_list, expected",
+        [(204, False, {}), (204, True, []), (200, False, {})],
+    )
+    def test_returns_empty_result_without_body(
+        self, gitlab_api, status_code, expect_list, expected
+    ):
+        response = make_response(b"", status_code=status_code)
+        gitlab_api._session = Mock()
+        gitlab_api._session.request.return_value = response
+
+        result = gitlab_api._make_request(
+            "DELETE", "/projects/1/pipelines/2", expect_list=expect_list
+        )
+
+        assert result == expected
+        response.json.assert_not_called()
+
+    def test_sends_if_none_match_for_cached_resource(self, gitlab_api):
+        first = make_response(b'{"id": 1}', headers={"ETag": 'W/"abc"'})
+        first.json.return_value = {"id": 1}
+        not_modified = make_response(b"", status_code=304)
+        gitlab_api._session = Mock()
+        gitlab_api._session.request.side_effect = [first, not_modified]
+
+        first_result = gitlab_api._make_request("GET", "/projects/1")
+        second_result = gitlab_api._make_request("GET", "/projects/1")
+
+        assert second_result is first_result
+        second_call = gitlab_api._session.request.call_args_list[1]
+        assert second_call.kwargs["headers"] == {"If-None-Match": 'W/"abc"'}
+        not_modified.json.assert_not_called()
+
+    def test_not_modified_after_eviction_returns_cached_response(self, gitlab_api):
+        first = make_response(b'{"id": 1}', headers={"ETag": '"abc"'})
+        first.json.return_value = {"id": 1}
+        not_modified = make_response(b"", status_code=304)
+        gitlab_api._session = Mock()
+        gitlab_api._session.request.return_value = first
+        first_result = gitlab_api._make_request("GET", "/projects/1")
+
+        def evict_then_not_modified(**kwargs):
+            # Another thread evicts the entry while this request is in flight
+            gitlab_api._etag_cache.clear()
+            return not_modified
+
+        gitlab_api._session.request.side_effect = evict_then_not_modified
+
+        assert gitlab_api._make_request("GET", "/projects/1") is first_result
+
+    def test_etag_cache_is_keyed_on_params(self, gitlab_api):
+        response = make_response(b"[]", headers={"ETag": '"abc"'})
+        response.json.return_value = []
+        gitlab_api._session = Mock()
+        gitlab_api._session.request.return_value = response
+
+        gitlab_api._make_request("GET", "/projects/1/pipelines", params={"ref": "a"})
+        gitlab_api._make_request("GET", "/projects/1/pipelines", params={"ref": "b"})
+
+        second_call = gitlab_api._session.request.call_args_list[1]
+        assert "headers" not in second_call.kwargs
+
+    def test_etag_cache_evicts_oldest_entry(self, gitlab_api, monkeypatch):
+        monkeypatch.setattr(GitlabAPI, "ETAG_CACHE_SIZE", 2)
+
+        for key in ("a", "b", "c"):
+            gitlab_api._store_etag(key, f'"{key}"', {})
+
+        assert list(gitlab_api._etag_cache) == ["b", "c"]
+
+
+class TestGetPipelineJobs:
+    """Test GitlabAPI.get_pipeline_jobs"""
+
+    @patch.object(GitlabAPI, "_make_request")
+    def test_requests_full_page_by_default(self, mock_request, gitlab_api):
+        mock_request.return_value = []
+
+        gitlab_api.get_pipeline_jobs("group/project", 100)
+
+        mock_request.assert_called_once_with(
+            "GET",
+            "/projects/group%2Fproject/pipelines/100/jobs",
+            params={"per_page": 100},
+            expect_list=True,
+        )
+
+
+class TestGitlabAPISlots:
+    """Test GitlabAPI.__slots__"""
+
+    def test_has_no_instance_dict(self, gitlab_api):
+        assert not hasattr(gitlab_api, "__dict__")
+
+    def test_rejects_unknown_attributes(self, gitlab_api):
+        with pytest.raises(AttributeError):
+            gitlab_api.base_url = "https://gitlab.example.com"
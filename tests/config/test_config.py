@@ -1,7 +1,7 @@
 """Tests for main Config class."""
 
 from logging import Logger
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, PropertyMock, patch
 
 import pytest
 
@@ -31,14 +31,17 @@ class TestConfigInit:
         config = Config(mock_logger)
         assert config.logger == mock_logger
 
-    def test_init_sets_all_attributes_to_none(self, mock_logger):
+    def test_init_does_not_load_any_component(self, mock_logger):
         config = Config(mock_logger)
-        assert config._git is None
-        assert config._config_reader is None
-        assert config._app is None
-        assert config._icons is None
-        assert config._theme is None
-        assert config._credentials is None
+        for name in (
+            "git",
+            "_config_reader",
+            "app",
+            "icons",
+            "theme",
+            "credentials",
+        ):
+            assert name not in config.__dict__
 
 
 class TestGitProperty:
@@ -71,100 +74,88 @@ class TestGitProperty:
 class TestAppProperty:
     """Test Config.app property"""
 
-    @patch.object(Config, "_get_config_reader")
-    def test_returns_app_config(self, mock_get_config_reader, config):
+    @patch("gitlab_tui.config.config.ConfigReader")
+    def test_returns_app_config(self, mock_config_reader_class, config):
         """Test app property returns AppConfig instance"""
-        mock_config_reader = Mock(spec=ConfigReader)
         mock_app_config = Mock(spec=AppConfig)
-        mock_config_reader.get_app_config.return_value = mock_app_config
-        mock_get_config_reader.return_value = mock_config_reader
+        mock_config_reader_class.return_value.app_config = mock_app_config
 
         result = config.app
 
         assert result == mock_app_config
-        mock_get_config_reader.assert_called_once()
-        mock_config_reader.get_app_config.assert_called_once()
+        mock_config_reader_class.assert_called_once_with(config.logger)
 
-    @patch.object(Config, "_get_config_reader")
-    def test_caches_app_config(self, mock_get_config_reader, config):
+    @patch("gitlab_tui.config.config.ConfigReader")
+    def test_caches_app_config(self, mock_config_reader_class, config):
         """Test app property caches the AppConfig instance"""
         mock_config_reader = Mock(spec=ConfigReader)
-        mock_app_config = Mock(spec=AppConfig)
-        mock_config_reader.get_app_config.return_value = mock_app_config
-        mock_get_config_reader.return_value = mock_config_reader
+        mock_app_config = PropertyMock(return_value=Mock(spec=AppConfig))
+        type(mock_config_reader).app_config = mock_app_config
+        mock_config_reader_class.return_value = mock_config_reader
 
         first_call = config.app
         second_call = config.app
 
         assert first_call is second_call
-        mock_get_config_reader.assert_called_once()  # Should only be called once due to caching
-        mock_config_reader.get_app_config.assert_called_once()
+        mock_app_config.assert_called_once()  # Should only be called once due to caching
 
 
 class TestIconsProperty:
     """Test Config.icons property"""
 
-    @patch.object(Config, "_get_config_reader")
-    def test_returns_icons_config(self, mock_get_config_reader, config):
+    @patch("gitlab_tui.config.config.ConfigReader")
+    def test_returns_icons_config(self, mock_config_reader_class, config):
         """Test icons property returns IconsConfig instance"""
-        mock_config_reader = Mock(spec=ConfigReader)
         mock_icons_config = Mock(spec=IconsConfig)
-        mock_config_reader.get_icons_config.return_value = mock_icons_config
-        mock_get_config_reader.return_value = mock_config_reader
+        mock_config_reader_class.return_value.icons_config = mock_icons_config
 
         result = config.icons
 
         assert result == mock_icons_config
-        mock_get_config_reader.assert_called_once()
-        mock_config_reader.get_icons_config.assert_called_once()
+        mock_config_reader_class.assert_called_once_with(config.logger)
 
-    @patch.object(Config, "_get_config_reader")
-    def test_caches_icons_config(self, mock_get_config_reader, config):
+    @patch("gitlab_tui.config.config.ConfigReader")
+    def test_caches_icons_config(self, mock_config_reader_class, config):
         """Test icons property caches the IconsConfig instance"""
         mock_config_reader = Mock(spec=ConfigReader)
-        mock_icons_config = Mock(spec=IconsConfig)
-        mock_config_reader.get_icons_config.return_value = mock_icons_config
-        mock_get_config_reader.return_value = mock_config_reader
+        mock_icons_config = PropertyMock(return_value=Mock(spec=IconsConfig))
+        type(mock_config_reader).icons_config = mock_icons_config
+        mock_config_reader_class.return_value = mock_config_reader
 
         first_call = config.icons
         second_call = config.icons
 
         assert first_call is second_call
-        mock_get_config_reader.assert_called_once()  # Should only be called once due to caching
-        mock_config_reader.get_icons_config.assert_called_once()
+        mock_icons_config.assert_called_once()  # Should only be called once due to caching
 
 
 class TestThemeProperty:
     """Test Config.theme property"""
 
-    @patch.object(Config, "_get_config_reader")
-    def test_returns_theme_config(self, mock_get_config_reader, config):
+    @patch("gitlab_tui.config.config.ConfigReader")
+    def test_returns_theme_config(self, mock_config_reader_class, config):
         """Test theme property returns ThemeConfig instance"""
-        mock_config_reader = Mock(spec=ConfigReader)
         mock_theme_config = Mock(spec=ThemeConfig)
-        mock_config_reader.get_theme_config.return_value = mock_theme_config
-        mock_get_config_reader.return_value = mock_config_reader
+        mock_config_reader_class.return_value.theme_config = mock_theme_config
 
         result = config.theme
 
         assert result == mock_theme_config
-        mock_get_config_reader.assert_called_once()
-        mock_config_reader.get_theme_config.assert_called_once()
+        mock_config_reader_class.assert_called_once_with(config.logger)
 
-    @patch.object(Config, "_get_config_reader")
-    def test_caches_theme_config(self, mock_get_config_reader, config):
+    @patch("gitlab_tui.config.config.ConfigReader")
+    def test_caches_theme_config(self, mock_config_reader_class, config):
         """Test theme property caches the ThemeConfig instance"""
         mock_config_reader = Mock(spec=ConfigReader)
-        mock_theme_config = Mock(spec=ThemeConfig)
-        mock_config_reader.get_theme_config.return_value = mock_theme_config
-        mock_get_config_reader.return_value = mock_config_reader
+        mock_theme_config = PropertyMock(return_value=Mock(spec=ThemeConfig))
+        type(mock_config_reader).theme_config = mock_theme_config
+        mock_config_reader_class.return_value = mock_config_reader
 
         first_call = config.theme
         second_call = config.theme
 
         assert first_call is second_call
-        mock_get_config_reader.assert_called_once()  # Should only be called once due to caching
-        mock_config_reader.get_theme_config.assert_called_once()
+        mock_theme_config.assert_called_once()  # Should only be called once due to caching
 
 
 class TestCredentialsProperty:
@@ -176,14 +167,13 @@ class TestCredentialsProperty:
         self, mock_git_property, mock_credentials_class, config
     ):
         """Test credentials property returns CredentialsManager instance"""
-        mock_git_property.get_domain.return_value = "gitlab.com"
+        mock_git_property.domain = "gitlab.com"
         mock_credentials_instance = Mock(spec=CredentialsManager)
         mock_credentials_class.return_value = mock_credentials_instance
 
         result = config.credentials
 
         assert result == mock_credentials_instance
-        mock_git_property.get_domain.assert_called_once()
         mock_credentials_class.assert_called_once_with(config.logger, "gitlab.com")
 
     @patch("gitlab_tui.config.config.CredentialsManager")
@@ -192,7 +182,7 @@ class TestCredentialsProperty:
         self, mock_git_property, mock_credentials_class, config
     ):
         """Test credentials property caches the CredentialsManager instance"""
-        mock_git_property.get_domain.return_value = "gitlab.com"
+        mock_git_property.domain = "gitlab.com"
         mock_credentials_instance = Mock(spec=CredentialsManager)
         mock_credentials_class.return_value = mock_credentials_instance
 
@@ -200,32 +190,31 @@ class TestCredentialsProperty:
         second_call = config.credentials
 
         assert first_call is second_call
-        mock_git_property.get_domain.assert_called_once()  # Should only be called once due to caching
         mock_credentials_class.assert_called_once()
 
 
-class TestGetConfigReader:
-    """Test Config._get_config_reader"""
+class TestConfigReaderProperty:
+    """Test Config._config_reader property"""
 
     @patch("gitlab_tui.config.config.ConfigReader")
     def test_returns_config_reader(self, mock_config_reader_class, config):
-        """Test _get_config_reader returns ConfigReader instance"""
+        """Test _config_reader returns ConfigReader instance"""
         mock_config_reader_instance = Mock(spec=ConfigReader)
         mock_config_reader_class.return_value = mock_config_reader_instance
 
-        result = config._get_config_reader()
+        result = config._config_reader
 
         assert result == mock_config_reader_instance
         mock_config_reader_class.assert_called_once_with(config.logger)
 
     @patch("gitlab_tui.config.config.ConfigReader")
     def test_caches_config_reader(self, mock_config_reader_class, config):
-        """Test _get_config_reader caches the ConfigReader instance"""
+        """Test _config_reader caches the ConfigReader instance"""
         mock_config_reader_instance = Mock(spec=ConfigReader)
         mock_config_reader_class.return_value = mock_config_reader_instance
 
-        first_call = config._get_config_reader()
-        second_call = config._get_config_reader()
+        first_call = config._config_reader
+        second_call = config._config_reader
 
         assert first_call is second_call
         mock_config_reader_class.assert_called_once()  # Should only be called once due to caching
@@ -243,17 +232,13 @@ class TestConfigIntegration:
         """Test that app, icons, and theme properties share the same ConfigReader instance"""
         # Setup mocks
         mock_git_instance = Mock(spec=GitContextResolver)
-        mock_git_instance.get_domain.return_value = "gitlab.com"
+        mock_git_instance.domain = "gitlab.com"
         mock_git_class.return_value = mock_git_instance
 
         mock_config_reader_instance = Mock(spec=ConfigReader)
-        mock_config_reader_instance.get_app_config.return_value = Mock(spec=AppConfig)
-        mock_config_reader_instance.get_icons_config.return_value = Mock(
-            spec=IconsConfig
-        )
-        mock_config_reader_instance.get_theme_config.return_value = Mock(
-            spec=ThemeConfig
-        )
+        mock_config_reader_instance.app_config = Mock(spec=AppConfig)
+        mock_config_reader_instance.icons_config = Mock(spec=IconsConfig)
+        mock_config_reader_instance.theme_config = Mock(spec=ThemeConfig)
         mock_config_reader_class.return_value = mock_config_reader_instance
 
         mock_credentials_instance = Mock(spec=CredentialsManager)
@@ -276,7 +261,7 @@ class TestConfigIntegration:
         """Test that credentials property correctly depends on git domain"""
         # Setup mocks
         mock_git_instance = Mock(spec=GitContextResolver)
-        mock_git_instance.get_domain.return_value = "gitlab.example.com"
+        mock_git_instance.domain = "gitlab.example.com"
         mock_git_class.return_value = mock_git_instance
 
         mock_credentials_instance = Mock(spec=CredentialsManager)
@@ -286,7 +271,6 @@ class TestConfigIntegration:
         result = config.credentials
 
         # Verify the domain was passed correctly
-        mock_git_instance.get_domain.assert_called_once()
         mock_credentials_class.assert_called_once_with(
             config.logger, "gitlab.example.com"
         )
@@ -8,7 +8,14 @@ from unittest.mock import Mock, patch
 import pytest
 
 from gitlab_tui.config.config_reader import ConfigReader
-from gitlab_tui.config.defaults import AppConfig, IconsConfig, ThemeConfig
+from gitlab_tui.config.defaults import (
+    DEFAULT_APP_CONFIG,
+    DEFAULT_ICONS_CONFIG,
+    DEFAULT_THEME_CONFIG,
+    AppConfig,
+    IconsConfig,
+    ThemeConfig,
+)
 
 
 @pytest.fixture
@@ -37,20 +44,31 @@ class TestConfigReaderInit:
         expected_path = Path.home() / ".config" / "gitlab-tui" / "config.toml"
         assert reader.config_file == expected_path
 
-    def test_init_sets_all_attributes_to_none(self, mock_logger):
+    def test_init_does_not_load_anything(self, mock_logger):
         reader = ConfigReader(mock_logger)
-        assert reader._app_config is None
-        assert reader._icons_config is None
-        assert reader._theme_config is None
+        for name in ("app_config", "icons_config", "theme_config", "_data"):
+            assert name not in reader.__dict__
 
 
 class TestLoadConfig:
     """Test ConfigReader._load_config"""
 
-    def test_returns_empty_dict_when_file_not_exists(self, config_reader):
+    @patch("tomllib.load")
+    def test_returns_empty_dict_when_file_not_exists(self, mock_load, config_reader):
         """Test returns empty dict when config file doesn't exist"""
         result = config_reader._load_config()
         assert result == {}
+        mock_load.assert_not_called()
+
+    @patch("tomllib.load")
+    def test_returns_empty_dict_when_file_empty(self, mock_load, config_reader):
+        """Test returns empty dict without parsing a zero-byte config file"""
+        config_reader.config_file.touch()
+
+        result = config_reader._load_config()
+
+        assert result == {}
+        mock_load.assert_not_called()
 
     def test_loads_and_returns_toml_data(self, config_reader):
         """Test loads and returns TOML data when file exists"""
@@ -88,9 +106,49 @@ class TestLoadConfig:
         }
         assert result == expected
 
+    @patch("tomllib.load")
+    def test_parses_file_only_once(self, mock_load, config_reader):
+        """Test caches parsed data across calls"""
+        config_reader.config_file.write_text('[app]\ntheme = "light"\n')
+        mock_load.return_value = {"app": {"theme": "light"}}
+
+        first = config_reader._load_config()
+        second = config_reader._load_config()
+
+        assert first is second
+        mock_load.assert_called_once()
+
+    @patch("tomllib.load")
+    def test_parses_file_once_across_getters(self, mock_load, config_reader):
+        """Test the app, icons and theme sections come from a single parse"""
+        config_reader.config_file.write_text('[app]\ntheme = "light"\n')
+        mock_load.return_value = {"app": {"theme": "light"}, "icons": {}}
+
+        config_reader.app_config
+        config_reader.icons_config
+        config_reader.theme_config
+
+        mock_load.assert_called_once()
+
+    @patch("tomllib.load")
+    def test_reuses_parse_across_readers_until_modified(
+        self, mock_load, config_reader, mock_logger
+    ):
+        """Test a new reader reuses the parsed file unless it changed"""
+        config_reader.config_file.write_text('[app]\ntheme = "light"\n')
+        mock_load.return_value = {"app": {"theme": "light"}}
+
+        config_reader._load_config()
+        ConfigReader(mock_logger)._load_config()
+        assert mock_load.call_count == 1
+
+        config_reader.config_file.write_text('[app]\ntheme = "dark"\n')
+        ConfigReader(mock_logger)._load_config()
+        assert mock_load.call_count == 2
+
 
-class TestGetAppConfig:
-    """Test ConfigReader.get_app_config"""
+class TestAppConfig:
+    """Test ConfigReader.app_config"""
 
     @patch.object(ConfigReader, "_load_config")
     def test_returns_app_config_successfully(self, mock_load_config, mock_logger):
@@ -104,7 +162,7 @@ class TestGetAppConfig:
         }
 
         reader = ConfigReader(mock_logger)
-        result = reader.get_app_config()
+        result = reader.app_config
 
         assert isinstance(result, AppConfig)
         assert result.theme == "light"
@@ -120,9 +178,10 @@ class TestGetAppConfig:
         mock_load_config.return_value = {}
 
         reader = ConfigReader(mock_logger)
-        result = reader.get_app_config()
+        result = reader.app_config
 
         assert isinstance(result, AppConfig)
+        assert result is DEFAULT_APP_CONFIG
         assert result.theme == "dark"  # default value
         assert result.auto_refresh == 300  # default value
         assert result.timestamp_format == "%m/%d/%y %H:%M"  # default value
@@ -134,15 +193,15 @@ class TestGetAppConfig:
         mock_load_config.return_value = {"app": {"theme": "light"}}
 
         reader = ConfigReader(mock_logger)
-        first_call = reader.get_app_config()
-        second_call = reader.get_app_config()
+        first_call = reader.app_config
+        second_call = reader.app_config
 
         assert first_call is second_call  # Same instance
         mock_load_config.assert_called_once()  # Should only be called once due to caching
 
 
-class TestGetIconsConfig:
-    """Test ConfigReader.get_icons_config"""
+class TestIconsConfig:
+    """Test ConfigReader.icons_config"""
 
     @patch.object(ConfigReader, "_load_config")
     def test_returns_icons_config_successfully(self, mock_load_config, mock_logger):
@@ -152,7 +211,7 @@ class TestGetIconsConfig:
         }
 
         reader = ConfigReader(mock_logger)
-        result = reader.get_icons_config()
+        result = reader.icons_config
 
         assert isinstance(result, IconsConfig)
         assert result.success == "✓"
@@ -168,9 +227,10 @@ class TestGetIconsConfig:
         mock_load_config.return_value = {}
 
         reader = ConfigReader(mock_logger)
-        result = reader.get_icons_config()
+        result = reader.icons_config
 
         assert isinstance(result, IconsConfig)
+        assert result is DEFAULT_ICONS_CONFIG
         assert result.default_icon == "?"  # default value
         assert result.success == "\uf058"  # default value
         mock_load_config.assert_called_once()
@@ -183,15 +243,15 @@ class TestGetIconsConfig:
         mock_load_config.return_value = {"icons": {"success": "✓"}}
 
         reader = ConfigReader(mock_logger)
-        first_call = reader.get_icons_config()
-        second_call = reader.get_icons_config()
+        first_call = reader.icons_config
+        second_call = reader.icons_config
 
         assert first_call is second_call  # Same instance
         mock_load_config.assert_called_once()  # Should only be called once due to caching
 
 
-class TestGetThemeConfig:
-    """Test ConfigReader.get_theme_config"""
+class TestThemeConfig:
+    """Test ConfigReader.theme_config"""
 
     @patch.object(ConfigReader, "_load_config")
     def test_returns_theme_config_successfully(self, mock_load_config, mock_logger):
@@ -205,7 +265,7 @@ class TestGetThemeConfig:
         }
 
         reader = ConfigReader(mock_logger)
-        result = reader.get_theme_config()
+        result = reader.theme_config
 
         assert isinstance(result, ThemeConfig)
         assert result.name == "custom-theme"
@@ -221,9 +281,10 @@ class TestGetThemeConfig:
         mock_load_config.return_value = {}
 
         reader = ConfigReader(mock_logger)
-        result = reader.get_theme_config()
+        result = reader.theme_config
 
         assert isinstance(result, ThemeConfig)
+        assert result is DEFAULT_THEME_CONFIG
         assert result.name == "catppuccin-mocha"  # default value
         assert result.primary == "#cba6f7"  # default value
         assert result.dark is True  # default value
@@ -237,8 +298,8 @@ class TestGetThemeConfig:
         mock_load_config.return_value = {"theme": {"name": "custom"}}
 
         reader = ConfigReader(mock_logger)
-        first_call = reader.get_theme_config()
-        second_call = reader.get_theme_config()
+        first_call = reader.theme_config
+        second_call = reader.theme_config
 
         assert first_call is second_call  # Same instance
         mock_load_config.assert_called_once()  # Should only be called once due to caching
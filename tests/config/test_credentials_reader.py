@@ -1,3 +1,4 @@
+import os
 from logging import Logger
 from pathlib import Path
 from textwrap import dedent
@@ -40,9 +41,9 @@ class TestCredentialsManagerInit:
         expected_path = Path.home() / ".config" / "gitlab-tui" / "credentials"
         assert manager.credentials_file == expected_path
 
-    def test_init_sets_token_to_none(self, mock_logger):
+    def test_init_does_not_load_token(self, mock_logger):
         manager = CredentialsManager(mock_logger, "gitlab.com")
-        assert manager._token is None
+        assert "token" not in manager.__dict__
 
 
 class TestLoadToken:
@@ -107,9 +108,51 @@ class TestLoadToken:
         actual = credentials_manager._load_token()
         assert actual == expected
 
+    @patch("tomllib.load")
+    def test_reuses_parsed_file_until_modified(
+        self, mock_load, credentials_manager, mock_logger
+    ):
+        credentials_file = credentials_manager.credentials_file
+        credentials_file.write_text('["gitlab.com"]\ntoken = "mock_token"\n')
+        mock_load.return_value = {"gitlab.com": {"token": "mock_token"}}
+        other_manager = CredentialsManager(mock_logger, "gitlab.com")
+
+        credentials_manager._load_token()
+        other_manager._load_token()
+        assert mock_load.call_count == 1
+
+        mtime = credentials_file.stat().st_mtime_ns + 1_000_000_000
+        os.utime(credentials_file, ns=(mtime, mtime))
+        other_manager._load_token()
+        assert mock_load.call_count == 2
+
+    @patch("tomllib.load")
+    def test_reparses_when_size_changes_within_same_mtime(
+        self, mock_load, credentials_manager
+    ):
+        credentials_file = credentials_manager.credentials_file
+        credentials_file.write_text('["gitlab.com"]\ntoken = "mock_token"\n')
+        mock_load.return_value = {"gitlab.com": {"token": "mock_token"}}
+        mtime = credentials_file.stat().st_mtime_ns
+
+        credentials_manager._load_token()
+        credentials_file.write_text('["gitlab.com"]\ntoken = "other_token"\n')
+        os.utime(credentials_file, ns=(mtime, mtime))
+        credentials_manager._load_token()
+
+        assert mock_load.call_count == 2
+
+    def test_reports_parse_error_for_malformed_file_without_domain(
+        self, credentials_manager
+    ):
+        credentials_manager.credentials_file.write_text('["gitlab.example.org"\n')
+
+        with pytest.raises(ConfigError, match="Failed to parse credentials file"):
+            credentials_manager._load_token()
+
 
 class TestGetToken:
-    """Test CredentialsManager.get_token"""
+    """Test CredentialsManager.token"""
 
     @patch.object(CredentialsManager, "_load_token")
     def test_returns_token_successfully(self, mock_load_token, mock_logger):
@@ -118,7 +161,7 @@ class TestGetToken:
         mock_load_token.return_value = expected
 
         manager = CredentialsManager(mock_logger, "gitlab.com")
-        actual = manager.get_token()
+        actual = manager.token
 
         assert actual == expected
         mock_load_token.assert_called_once()
@@ -130,8 +173,8 @@ class TestGetToken:
         mock_load_token.return_value = expected
 
         manager = CredentialsManager(mock_logger, "gitlab.com")
-        first_call = manager.get_token()
-        second_call = manager.get_token()
+        first_call = manager.token
+        second_call = manager.token
 
         assert first_call == expected
         assert second_call == expected
@@ -0,0 +1,81 @@
+"""Tests for default configuration dataclasses."""
+
+from dataclasses import FrozenInstanceError, fields
+
+import pytest
+
+from gitlab_tui.config.defaults import AppConfig, IconsConfig, ThemeConfig
+
+
+class TestIconsConfigGet:
+    """Test IconsConfig.get"""
+
+    def test_returns_icon_for_known_status(self):
+        icons = IconsConfig(success="ok")
+        assert icons.get("success") == "ok"
+
+    def test_returns_default_icon_for_unknown_status(self):
+        icons = IconsConfig(default_icon="?")
+        assert icons.get("waiting_for_resource") == "?"
+
+    def test_returns_given_default_for_unknown_status(self):
+        icons = IconsConfig()
+        assert icons.get("waiting_for_resource", "x") == "x"
+
+    def test_does_not_return_methods(self):
+        icons = IconsConfig(default_icon="?")
+        assert icons.get("get") == "?"
+
+    def test_ignores_icon_map_in_equality_and_repr(self):
+        assert IconsConfig() == IconsConfig()
+        assert "_map" not in repr(IconsConfig())
+
+
+@pytest.mark.parametrize("config_class", [AppConfig, IconsConfig, ThemeConfig])
+class TestConfigDataclasses:
+    """Test the config dataclasses are slotted and immutable"""
+
+    def test_has_no_instance_dict(self, config_class):
+        assert not hasattr(config_class(), "__dict__")
+
+    def test_rejects_assignment(self, config_class):
+        instance = config_class()
+        with pytest.raises(FrozenInstanceError):
+            setattr(instance, fields(instance)[0].name, "x")
+
+
+class TestThemeConfigVariables:
+    """Test ThemeConfig.variables"""
+
+    def test_default_variables_are_shared_and_read_only(self):
+        first, second = ThemeConfig(), ThemeConfig()
+
+        assert first.variables is second.variables
+        with pytest.raises(TypeError):
+            first.variables["text_primary"] = "#000000"  # type: ignore[index]
+
+
+class TestThemeConfigTextSecondary:
+    """Test ThemeConfig.text_secondary"""
+
+    def test_reads_text_secondary_from_variables(self):
+        theme_config = ThemeConfig(variables={"text_secondary": "#111111"})
+        assert theme_config.text_secondary == "#111111"
+
+    def test_falls_back_to_default_when_variable_missing(self):
+        assert ThemeConfig(variables={}).text_secondary == "#bac2de"
+
+
+class TestThemeConfigToThemeKwargs:
+    """Test ThemeConfig.to_theme_kwargs"""
+
+    def test_returns_all_fields_with_a_variables_copy(self):
+        theme_config = ThemeConfig(name="custom", variables={"a": "b"})
+
+        kwargs = theme_config.to_theme_kwargs()
+
+        assert kwargs["name"] == "custom"
+        assert kwargs["primary"] == theme_config.primary
+        assert kwargs["variables"] == {"a": "b"}
+        assert kwargs["variables"] is not theme_config.variables
+        assert "text_secondary" not in kwargs
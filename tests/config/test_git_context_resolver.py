@@ -1,11 +1,13 @@
 from logging import Logger
-from pathlib import Path
 from subprocess import CalledProcessError
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from gitlab_tui.config.git_context_resolver import GitContextResolver
+from gitlab_tui.config.git_context_resolver import (
+    GitContextResolver,
+    _parse_remote_url,
+)
 from gitlab_tui.utils.exceptions import ConfigError
 
 
@@ -28,22 +30,21 @@ class TestGitContextResolverInit:
         resolver = GitContextResolver(mock_logger)
         assert resolver.logger == mock_logger
 
-    def test_init_sets_all_attributes_to_none(self, mock_logger):
+    def test_init_does_not_resolve_anything(self, mock_logger):
         resolver = GitContextResolver(mock_logger)
-        assert resolver._remote_url is None
-        assert resolver._project_path is None
-        assert resolver._domain is None
-        assert resolver._current_branch is None
+        for name in ("remote_url", "project_path", "domain", "current_branch"):
+            assert name not in resolver.__dict__
 
 
+@patch.object(GitContextResolver, "_read_remote_url", return_value=None)
 @patch("subprocess.run")
 class TestInitRemoteUrl:
     """Test GitContextResolver._init_git_remote_url"""
 
-    def test_returns_remote_url_successfully(self, mock_run, git_resolver):
+    def test_returns_remote_url_successfully(self, mock_run, _mock_read, git_resolver):
         """Test successful retrieval of URL and any whitespace is stripped"""
         mock_run.return_value = MagicMock(
-            stdout=" https://gitlab.com/user/project.git  \n", returncode=0
+            stdout=b" https://gitlab.com/user/project.git  \n", returncode=0
         )
 
         result = git_resolver._init_remote_url()
@@ -52,12 +53,12 @@ class TestInitRemoteUrl:
         mock_run.assert_called_once_with(
             ["git", "config", "--get", "remote.origin.url"],
             capture_output=True,
-            text=True,
             check=True,
-            cwd=Path.cwd(),
         )
 
-    def test_raises_config_error_when_not_in_git_repo(self, mock_run, git_resolver):
+    def test_raises_config_error_when_not_in_git_repo(
+        self, mock_run, _mock_read, git_resolver
+    ):
         """Test error when not in a git repository"""
         mock_run.side_effect = CalledProcessError(1, "git")
 
@@ -66,7 +67,9 @@ class TestInitRemoteUrl:
         ):
             git_resolver._init_remote_url()
 
-    def test_raises_config_error_when_git_not_found(self, mock_run, git_resolver):
+    def test_raises_config_error_when_git_not_found(
+        self, mock_run, _mock_read, git_resolver
+    ):
         """Test error when git command is not found."""
         mock_run.side_effect = FileNotFoundError()
 
@@ -74,8 +77,157 @@ class TestInitRemoteUrl:
             git_resolver._init_remote_url()
 
 
-class TestGetProjectPathFromUrl:
-    """Test GitContextResolver._get_project_path_from_url"""
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """Create a minimal .git directory and chdir into a subdirectory of it"""
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text("ref: refs/heads/feature/mock_branch_name\n")
+    (git_dir / "config").write_text(
+        "[core]\n"
+        "\tbare = false\n"
+        '[remote "upstream"]\n'
+        "\turl = https://gitlab.com/upstream/project.git\n"
+        '[remote "origin"]\n'
+        "\turl = git@gitlab.com:group/project.git\n"
+        "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+    )
+    subdir = tmp_path / "src"
+    subdir.mkdir()
+    monkeypatch.chdir(subdir)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    return git_dir
+
+
+@patch("subprocess.run")
+class TestReadGitFiles:
+    """Test GitContextResolver reading .git files directly"""
+
+    def test_reads_remote_url_without_git(self, mock_run, git_repo, git_resolver):
+        assert git_resolver._init_remote_url() == "git@gitlab.com:group/project.git"
+        mock_run.assert_not_called()
+
+    def test_reads_current_branch_without_git(self, mock_run, git_repo, git_resolver):
+        assert git_resolver._init_current_branch() == "feature/mock_branch_name"
+        mock_run.assert_not_called()
+
+    def test_reports_detached_head(self, mock_run, git_repo, git_resolver):
+        (git_repo / "HEAD").write_text("0123456789abcdef0123456789abcdef01234567\n")
+
+        assert git_resolver._init_current_branch() == "HEAD"
+
+    def test_falls_back_to_git_for_reftable_stub_head(
+        self, mock_run, git_repo, git_resolver
+    ):
+        (git_repo / "HEAD").write_text("ref: refs/heads/.invalid\n")
+        mock_run.return_value = MagicMock(stdout=b"main\n")
+
+        assert git_resolver._init_current_branch() == "main"
+        mock_run.assert_called_once()
+
+    def test_follows_worktree_gitdir_file(
+        self, mock_run, git_repo, git_resolver, tmp_path, monkeypatch
+    ):
+        worktree_git_dir = git_repo / "worktrees" / "wt"
+        worktree_git_dir.mkdir(parents=True)
+        (worktree_git_dir / "HEAD").write_text("ref: refs/heads/wt-branch\n")
+        (worktree_git_dir / "commondir").write_text("../..\n")
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {worktree_git_dir}\n")
+        monkeypatch.chdir(worktree)
+
+        assert git_resolver._init_current_branch() == "wt-branch"
+        assert git_resolver._init_remote_url() == "git@gitlab.com:group/project.git"
+        mock_run.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            '[remote "origin"]\n\turl = git@gitlab.com:group/project.git # mirror\n',
+            '[Remote "origin"]\n\turl = git@gitlab.com:group/project.git\n',
+            '[remote "origin"]\n\turl = "git@gitlab.com:group/project.git" ; ssh\n',
+            "[REMOTE.origin]\n\tURL = git@gitlab.com:group/project.git\n",
+        ],
+    )
+    def test_reads_remote_url_variants(self, mock_run, git_repo, git_resolver, config):
+        (git_repo / "config").write_text(config)
+
+        assert git_resolver._init_remote_url() == "git@gitlab.com:group/project.git"
+        mock_run.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            '[remote "origin"]\n\turl = "git@gitlab.com:group/pro\\"ject.git"\n',
+            '[remote "origin"]\n\turl = "git@gitlab.com:group/project.git\n',
+            '[remote "origin"] url = git@gitlab.com:group/project.git\n',
+        ],
+    )
+    def test_falls_back_to_git_when_ambiguous(
+        self, mock_run, git_repo, git_resolver, config
+    ):
+        (git_repo / "config").write_text(config)
+        mock_run.return_value = MagicMock(stdout=b"https://gitlab.com/a/b.git\n")
+
+        assert git_resolver._init_remote_url() == "https://gitlab.com/a/b.git"
+        mock_run.assert_called_once()
+
+    def test_falls_back_to_git_without_origin(self, mock_run, git_repo, git_resolver):
+        (git_repo / "config").write_text("[core]\n\tbare = false\n")
+        mock_run.return_value = MagicMock(stdout=b"https://gitlab.com/a/b.git\n")
+
+        assert git_resolver._init_remote_url() == "https://gitlab.com/a/b.git"
+        mock_run.assert_called_once()
+
+
+class TestParseRemoteUrl:
+    """Test _parse_remote_url"""
+
+    @pytest.mark.parametrize(
+        "input, expected",
+        [
+            ("https://gitlab.com/group/project.git/", ("gitlab.com", "group/project")),
+            ("git@gitlab.com:group/project.git", ("gitlab.com", "group/project")),
+            (
+                "http://gitlab.example.com/group/subgroup/project",
+                ("gitlab.example.com", "group/subgroup/project"),
+            ),
+            ("ssh://git@gitlab.com/group/project.git", ("gitlab.com", "group/project")),
+        ],
+    )
+    def test_returns_domain_and_project_path(self, input, expected):
+        assert _parse_remote_url(input) == expected
+
+    def test_caches_parsed_urls(self):
+        url = "git@gitlab.com:group/project.git"
+        _parse_remote_url.cache_clear()
+
+        _parse_remote_url(url)
+        _parse_remote_url(url)
+
+        assert _parse_remote_url.cache_info().hits == 1
+
+    @pytest.mark.parametrize(
+        "input",
+        [
+            "git@gitlab.com//",
+            "gitlab.com/group",
+            "git@gitlab.com:",
+            "https://",
+            "https://gitlab.com//group/project",
+            "git@gitlab.com:group//project.git",
+            "https://gitlab.com/group/.git",
+        ],
+    )
+    def test_fails_on_unexpected_url_format(self, input):
+        with pytest.raises(ConfigError, match="Unexpected url format"):
+            _parse_remote_url(input)
+
+
+@patch.object(GitContextResolver, "_init_remote_url")
+class TestProjectPathFromUrl:
+    """Test GitContextResolver.project_path for each remote url format"""
 
     @pytest.mark.parametrize(
         "input, expected",
@@ -98,22 +250,27 @@ class TestGetProjectPathFromUrl:
             ),
         ],
     )
-    def test_correctly_parses_remote_url(self, git_resolver, input, expected):
+    def test_correctly_parses_remote_url(
+        self, mock_remote_url, git_resolver, input, expected
+    ):
         """Test that the parser correctly returns the project path for all variations of inputs"""
-        actual = git_resolver._get_project_path_from_url(input)
+        mock_remote_url.return_value = input
+
+        actual = git_resolver.project_path
 
         assert actual == expected
 
-    def test_fails_on_unepected_url_format(self, git_resolver):
+    def test_fails_on_unepected_url_format(self, mock_remote_url, git_resolver):
         """Test that the error is returned when recieving malformed remote url"""
-        remote_url = "git@gitlab.com//"
+        mock_remote_url.return_value = "git@gitlab.com//"
 
         with pytest.raises(ConfigError, match="Unexpected url format"):
-            git_resolver._get_project_path_from_url(remote_url)
+            git_resolver.project_path
 
 
-class TestGetDomainFromUrl:
-    """Test GitContextResolver._get_domain_from_url"""
+@patch.object(GitContextResolver, "_init_remote_url")
+class TestDomainFromUrl:
+    """Test GitContextResolver.domain for each remote url format"""
 
     @pytest.mark.parametrize(
         "input, expected",
@@ -136,28 +293,35 @@ class TestGetDomainFromUrl:
             ),
         ],
     )
-    def test_correctly_parses_remote_url(self, git_resolver, input, expected):
+    def test_correctly_parses_remote_url(
+        self, mock_remote_url, git_resolver, input, expected
+    ):
         """Test that the parser correctly returns the domain for all variations of inputs"""
-        actual = git_resolver._get_domain_from_url(input)
+        mock_remote_url.return_value = input
+
+        actual = git_resolver.domain
 
         assert actual == expected
 
-    def test_fails_on_unepected_url_format(self, git_resolver):
+    def test_fails_on_unepected_url_format(self, mock_remote_url, git_resolver):
         """Test that the error is returned when recieving malformed remote url"""
-        remote_url = "git@gitlab.com//"
+        mock_remote_url.return_value = "git@gitlab.com//"
 
         with pytest.raises(ConfigError, match="Unexpected url format"):
-            git_resolver._get_domain_from_url(remote_url)
+            git_resolver.domain
 
 
+@patch.object(GitContextResolver, "_read_current_branch", return_value=None)
 @patch("subprocess.run")
 class TestInitCurrentBranch:
     """Test GitContextResolver._init_current_branch"""
 
-    def test_returns_current_branch_successfully(self, mock_run, git_resolver):
+    def test_returns_current_branch_successfully(
+        self, mock_run, _mock_read, git_resolver
+    ):
         """Test successful retrieval of current branch and any whitespace is stripped"""
         mock_run.return_value = MagicMock(
-            stdout=" feature/mock_branch_name \n", returncode=0
+            stdout=b" feature/mock_branch_name \n", returncode=0
         )
 
         result = git_resolver._init_current_branch()
@@ -166,12 +330,12 @@ class TestInitCurrentBranch:
         mock_run.assert_called_once_with(
             ["git", "rev-parse", "--abbrev-ref", "HEAD"],
             capture_output=True,
-            text=True,
             check=True,
-            cwd=Path.cwd(),
         )
 
-    def test_raises_config_error_when_not_in_git_repo(self, mock_run, git_resolver):
+    def test_raises_config_error_when_not_in_git_repo(
+        self, mock_run, _mock_read, git_resolver
+    ):
         """Test error when not in a git repository"""
         mock_run.side_effect = CalledProcessError(1, "git")
 
@@ -179,8 +343,8 @@ class TestInitCurrentBranch:
             git_resolver._init_current_branch()
 
 
-class TestGetRemoteUrl:
-    """Test GitContextResolver.get_remote_url"""
+class TestRemoteUrl:
+    """Test GitContextResolver.remote_url"""
 
     @patch.object(GitContextResolver, "_init_remote_url")
     def test_returns_remote_url_successfully(self, mock_remote, mock_logger):
@@ -189,110 +353,110 @@ class TestGetRemoteUrl:
         mock_remote.return_value = expected
 
         resolver = GitContextResolver(mock_logger)
-        actual = resolver.get_remote_url()
+        actual = resolver.remote_url
 
         assert actual == expected
         mock_remote.assert_called_once()
 
     @patch.object(GitContextResolver, "_init_remote_url")
     def test_caches_remote_url_on_subsequent_calls(self, mock_remote, mock_logger):
-        """Test that remote url is cached after first call"""
+        """Test that remote url is cached after first access"""
         expected = "https://gitlab.com/group/project.git"
         mock_remote.return_value = expected
 
         resolver = GitContextResolver(mock_logger)
-        first_call = resolver.get_remote_url()
-        second_call = resolver.get_remote_url()
+        first_call = resolver.remote_url
+        second_call = resolver.remote_url
 
         assert first_call == expected
         assert second_call == expected
         mock_remote.assert_called_once()  # Should only be called once due to caching
 
 
-class TestGetDomain:
-    """Test GitContextResolver.get_domain"""
+class TestDomain:
+    """Test GitContextResolver.domain"""
 
-    @patch.object(GitContextResolver, "get_remote_url")
-    @patch.object(GitContextResolver, "_get_domain_from_url")
+    @patch.object(GitContextResolver, "_init_remote_url")
+    @patch("gitlab_tui.config.git_context_resolver._parse_remote_url")
     def test_returns_domain_successfully(
-        self, mock_get_domain, mock_remote_url, mock_logger
+        self, mock_parse_remote_url, mock_remote_url, mock_logger
     ):
         """Test successful retrieval of domain with lazy initialization"""
         mock_remote_url.return_value = "https://gitlab.company.com/group/project.git"
         expected = "gitlab.company.com"
-        mock_get_domain.return_value = expected
+        mock_parse_remote_url.return_value = (expected, "group/project")
 
         resolver = GitContextResolver(mock_logger)
-        actual = resolver.get_domain()
+        actual = resolver.domain
 
         assert actual == expected
         mock_remote_url.assert_called_once()
-        mock_get_domain.assert_called_once_with(
+        mock_parse_remote_url.assert_called_once_with(
             "https://gitlab.company.com/group/project.git"
         )
 
-    @patch.object(GitContextResolver, "get_remote_url")
-    @patch.object(GitContextResolver, "_get_domain_from_url")
+    @patch.object(GitContextResolver, "_init_remote_url")
+    @patch("gitlab_tui.config.git_context_resolver._parse_remote_url")
     def test_caches_domain_on_subsequent_calls(
-        self, mock_get_domain, mock_remote_url, mock_logger
+        self, mock_parse_remote_url, mock_remote_url, mock_logger
     ):
-        """Test that domain is cached after first call"""
+        """Test that domain is cached after first access"""
         mock_remote_url.return_value = "https://gitlab.company.com/group/project.git"
         expected = "gitlab.company.com"
-        mock_get_domain.return_value = expected
+        mock_parse_remote_url.return_value = (expected, "group/project")
 
         resolver = GitContextResolver(mock_logger)
-        first_call = resolver.get_domain()
-        second_call = resolver.get_domain()
+        first_call = resolver.domain
+        second_call = resolver.domain
 
         assert first_call == expected
         assert second_call == expected
         mock_remote_url.assert_called_once()  # Should only be called once due to caching
-        mock_get_domain.assert_called_once()  # Should only be called once due to caching
+        mock_parse_remote_url.assert_called_once()  # Should only be called once due to caching
 
 
-class TestGetProjectPath:
-    """Test GitContextResolver.get_project_path"""
+class TestProjectPath:
+    """Test GitContextResolver.project_path"""
 
-    @patch.object(GitContextResolver, "get_remote_url")
-    @patch.object(GitContextResolver, "_get_project_path_from_url")
+    @patch.object(GitContextResolver, "_init_remote_url")
+    @patch("gitlab_tui.config.git_context_resolver._parse_remote_url")
     def test_returns_project_path_successfully(
-        self, mock_get_path, mock_remote_url, mock_logger
+        self, mock_parse_remote_url, mock_remote_url, mock_logger
     ):
         """Test successful retrieval of project path with lazy initialization"""
         mock_remote_url.return_value = "https://gitlab.com/group/project.git"
         expected = "group/project"
-        mock_get_path.return_value = expected
+        mock_parse_remote_url.return_value = ("gitlab.com", expected)
 
         resolver = GitContextResolver(mock_logger)
-        actual = resolver.get_project_path()
+        actual = resolver.project_path
 
         assert actual == expected
         mock_remote_url.assert_called_once()
-        mock_get_path.assert_called_once_with("https://gitlab.com/group/project.git")
+        mock_parse_remote_url.assert_called_once_with(
+            "https://gitlab.com/group/project.git"
+        )
 
-    @patch.object(GitContextResolver, "get_remote_url")
-    @patch.object(GitContextResolver, "_get_project_path_from_url")
-    def test_caches_project_path_on_subsequent_calls(
-        self, mock_get_path, mock_remote_url, mock_logger
+    @patch.object(GitContextResolver, "_init_remote_url")
+    @patch("gitlab_tui.config.git_context_resolver._parse_remote_url")
+    def test_shares_parsed_remote_url_with_domain(
+        self, mock_parse_remote_url, mock_remote_url, mock_logger
     ):
-        """Test that project path is cached after first call"""
+        """Test that the remote url is only resolved and parsed once for domain and path"""
         mock_remote_url.return_value = "https://gitlab.com/group/project.git"
-        expected = "group/project"
-        mock_get_path.return_value = expected
+        mock_parse_remote_url.return_value = ("gitlab.com", "group/project")
 
         resolver = GitContextResolver(mock_logger)
-        first_call = resolver.get_project_path()
-        second_call = resolver.get_project_path()
+        _ = resolver.project_path
+        _ = resolver.project_path
+        _ = resolver.domain
 
-        assert first_call == expected
-        assert second_call == expected
         mock_remote_url.assert_called_once()  # Should only be called once due to caching
-        mock_get_path.assert_called_once()  # Should only be called once due to caching
+        mock_parse_remote_url.assert_called_once()  # Should only be called once due to caching
 
 
 class TestCurrentBranch:
-    """Test GitContextResolver.get_current_branch"""
+    """Test GitContextResolver.current_branch"""
 
     @patch.object(GitContextResolver, "_init_current_branch")
     def test_returns_current_branch_successfully(self, mock_branch, mock_logger):
@@ -301,20 +465,20 @@ class TestCurrentBranch:
         mock_branch.return_value = expected
 
         resolver = GitContextResolver(mock_logger)
-        actual = resolver.get_current_branch()
+        actual = resolver.current_branch
 
         assert actual == expected
         mock_branch.assert_called_once()
 
     @patch.object(GitContextResolver, "_init_current_branch")
     def test_caches_current_branch_on_subsequent_calls(self, mock_branch, mock_logger):
-        """Test that current branch is cached after first call"""
+        """Test that current branch is cached after first access"""
         expected = "feature/mock_branch_name"
         mock_branch.return_value = expected
 
         resolver = GitContextResolver(mock_logger)
-        first_call = resolver.get_current_branch()
-        second_call = resolver.get_current_branch()
+        first_call = resolver.current_branch
+        second_call = resolver.current_branch
 
         assert first_call == expected
         assert second_call == expected
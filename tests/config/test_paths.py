@@ -0,0 +1,27 @@
+"""Tests for configuration paths."""
+
+from pathlib import Path
+
+import pytest
+
+from gitlab_tui.config.paths import _config_home
+
+
+class TestConfigHome:
+    """Test _config_home"""
+
+    def test_uses_absolute_xdg_config_home(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+        assert _config_home() == tmp_path
+
+    @pytest.mark.parametrize("value", ["", "relative/config", "./config"])
+    def test_falls_back_to_home_config(self, monkeypatch, value):
+        monkeypatch.setenv("XDG_CONFIG_HOME", value)
+
+        assert _config_home() == Path.home() / ".config"
+
+    def test_falls_back_when_unset(self, monkeypatch):
+        monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+
+        assert _config_home() == Path.home() / ".config"
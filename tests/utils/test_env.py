@@ -0,0 +1,23 @@
+"""Tests for environment helpers."""
+
+import pytest
+
+from gitlab_tui.utils.env import env_flag
+
+
+class TestEnvFlag:
+    """Test env_flag"""
+
+    @pytest.mark.parametrize("value", ["true", "TRUE", "1", " 1", "yes\n", "Yes"])
+    def test_truthy_values(self, monkeypatch, value):
+        monkeypatch.setenv("DEBUG", value)
+        assert env_flag("DEBUG") is True
+
+    @pytest.mark.parametrize("value", ["", "0", "false", "no", "on"])
+    def test_falsy_values(self, monkeypatch, value):
+        monkeypatch.setenv("DEBUG", value)
+        assert env_flag("DEBUG") is False
+
+    def test_unset(self, monkeypatch):
+        monkeypatch.delenv("DEBUG", raising=False)
+        assert env_flag("DEBUG") is False
@@ -0,0 +1,49 @@
+"""Tests for logging setup."""
+
+from logging import getLogger
+from unittest.mock import patch
+
+import pytest
+
+from gitlab_tui.utils import logger as logger_module
+from gitlab_tui.utils.logger import get_logger
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    """Point the log file at a temporary directory"""
+    path = tmp_path / "logs" / "gitlab-tui.log"
+    monkeypatch.setattr(logger_module, "LOG_FILE", path)
+    yield path
+    logger_module._stop_listener()
+    logger = getLogger("gitlab_tui")
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
+
+
+class TestGetLogger:
+    """Test get_logger"""
+
+    @patch.dict("os.environ", {"DEBUG": ""})
+    def test_writes_only_errors_outside_debug_mode(self, log_file):
+        logger = get_logger()
+
+        logger.info("starting")
+        assert not log_file.exists()
+
+        logger.error("failed")
+        for handler in logger.handlers:
+            handler.flush()
+
+        assert log_file.read_text().splitlines()[-1].endswith("ERROR - failed")
+        assert "starting" not in log_file.read_text()
+
+    @patch.dict("os.environ", {"DEBUG": "true"})
+    def test_writes_debug_records_in_debug_mode(self, log_file):
+        logger = get_logger()
+
+        logger.debug("details")
+        logger_module._stop_listener()
+
+        assert "DEBUG - details" in log_file.read_text()